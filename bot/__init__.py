@@ -1 +1,4 @@
-from .bot import HentaiBot
\ No newline at end of file
+from .cogs.utils.startup_profile import startup_profiler
+
+with startup_profiler.phase("imports"):
+    from .bot import HentaiBot
@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 import sys
+import time
 import asyncio
 
 import discord
@@ -10,6 +11,18 @@ from discord import app_commands
 from dotenv import load_dotenv
 import os
 
+from .cogs.utils.byte_cache import ByteCache
+from .cogs.utils.cdn_cache import CdnUrlCache
+from .cogs.utils.character_data import data_file_path
+from .cogs.utils.command_sync import CommandSyncState, sync_if_changed
+from .cogs.utils.disk_cache import DiskCache
+from .cogs.utils.io_pool import BlockingIOPool
+from .cogs.utils.jobs import JobQueue
+from .cogs.utils.registry import CharacterRegistry, build_registry, get_registry, set_registry
+from .cogs.utils.startup_profile import startup_profiler
+from .cogs.utils.transcode import MediaTranscoder
+from .cogs.utils.upload_scheduler import UploadScheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +45,34 @@ class BotConfig:
         self.prefix: str = self._get_env("BOT_PREFIX", "!")
         self.cogs_dir: Path = Path("./bot/cogs")
         self.application_id: int = int(self._get_required_env("APPLICATION_ID"))
+        self.media_watch: bool = self._get_env("MEDIA_WATCH", "true").lower() in ("1", "true", "yes")
+        self.media_poll_interval: float = float(self._get_env("MEDIA_POLL_INTERVAL", "5"))
+        self.media_catalog_path: str = self._get_env("MEDIA_CATALOG", "./data/media_catalog.sqlite3")
+        self.media_cas_dir: str = self._get_env("MEDIA_CAS_DIR", "./hentai/.cas")
+        self.media_io_workers: int = int(self._get_env("MEDIA_IO_WORKERS", "4"))
+        self.media_io_queue_depth: int = int(self._get_env("MEDIA_IO_QUEUE_DEPTH", "32"))
+        self.upload_concurrency: int = int(self._get_env("UPLOAD_CONCURRENCY", "4"))
+        self.upload_route_concurrency: int = int(self._get_env("UPLOAD_ROUTE_CONCURRENCY", "2"))
+        self.upload_queue_depth: int = int(self._get_env("UPLOAD_QUEUE_DEPTH", "32"))
+        self.upload_max_wait: float = float(self._get_env("UPLOAD_MAX_WAIT", "60"))
+        self.coalesce_window: float = float(self._get_env("COALESCE_WINDOW", "1.0"))
+        self.job_workers: int = int(self._get_env("JOB_WORKERS", "8"))
+        self.job_queue_depth: int = int(self._get_env("JOB_QUEUE_DEPTH", "64"))
+        # 0 lets Discord recommend a shard count
+        self.shard_count: int = int(self._get_env("SHARD_COUNT", "0"))
+        self.shard_clusters: int = int(self._get_env("SHARD_CLUSTERS", "1"))
+        self.cdn_cache_entries: int = int(self._get_env("CDN_CACHE_ENTRIES", "10000"))
+        self.media_cache_bytes: int = int(self._get_env("MEDIA_CACHE_BYTES", str(256 * 1024 * 1024)))
+        self.prefetch_bytes: int = int(self._get_env("PREFETCH_BYTES", str(64 * 1024 * 1024)))
+        self.variant_cache_dir: str = self._get_env("VARIANT_CACHE_DIR", "./data/variants")
+        self.variant_cache_bytes: int = int(self._get_env("VARIANT_CACHE_BYTES", str(2 * 1024 * 1024 * 1024)))
+        self.transcode_workers: int = int(self._get_env("TRANSCODE_WORKERS", "2"))
+        self.gif_transcode_format: str = self._get_env("GIF_TRANSCODE_FORMAT", "webp").lower()
+        self.character_data_watch: bool = self._get_env("CHARACTER_DATA_WATCH", "true").lower() in ("1", "true", "yes")
+        self.character_data_poll_interval: float = float(self._get_env("CHARACTER_DATA_POLL_INTERVAL", "5"))
+        self.command_sync_state: str = self._get_env("COMMAND_SYNC_STATE", "./data/command_sync.json")
+        self.startup_budget: float = float(self._get_env("STARTUP_BUDGET", "0"))
+        self.startup_budget_strict: bool = self._get_env("STARTUP_BUDGET_STRICT", "false").lower() in ("1", "true", "yes")
 
     @staticmethod
     def _get_required_env(key: str) -> str:
@@ -45,12 +86,42 @@ class BotConfig:
         return os.getenv(key, default)
 
 
-class HentaiBot(commands.Bot):
-    """Main bot class with improved error handling and logging."""
+class HentaiBot(commands.AutoShardedBot):
+    """Main bot class with improved error handling and logging.
+
+    Runs every shard in this process by default. The launcher can start
+    several processes ("clusters"), each given its own range of shard_ids.
+    """
 
-    def __init__(self):
+    def __init__(self, shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None,
+                 cluster_id: Optional[int] = None):
+        self._init_started = time.perf_counter()
+        self.cluster_id = cluster_id
+        self._setup_finished = self._init_started
+        self.startup_budget_exceeded = False
         self.config = BotConfig()
         self._cogs: List[str] = self._load_cog_list()
+        self.io_pool = BlockingIOPool(
+            max_workers=self.config.media_io_workers,
+            max_queue=self.config.media_io_queue_depth
+        )
+        self.upload_scheduler = UploadScheduler(
+            max_concurrent=self.config.upload_concurrency,
+            per_route=self.config.upload_route_concurrency,
+            max_queue=self.config.upload_queue_depth,
+            max_wait=self.config.upload_max_wait
+        )
+        self.job_queue = JobQueue(workers=self.config.job_workers, max_depth=self.config.job_queue_depth)
+        self.cdn_cache = CdnUrlCache(max_entries=self.config.cdn_cache_entries)
+        self.byte_cache = ByteCache(max_bytes=self.config.media_cache_bytes)
+        self.transcoder = MediaTranscoder(
+            DiskCache(self.config.variant_cache_dir, self.config.variant_cache_bytes),
+            max_workers=self.config.transcode_workers
+        )
+        self.command_sync_state = CommandSyncState(self.config.command_sync_state)
+        self._registry_lock = asyncio.Lock()
+        self._character_watch_task: Optional[asyncio.Task] = None
+        self._registry_warm_task: Optional[asyncio.Task] = None
 
         # Set up proper intents
         intents = discord.Intents.default()
@@ -62,28 +133,110 @@ class HentaiBot(commands.Bot):
             command_prefix=self._get_prefix,
             case_insensitive=True,
             intents=intents,
-            application_id=int(self.config._get_required_env("APPLICATION_ID"))
+            application_id=int(self.config._get_required_env("APPLICATION_ID")),
+            shard_ids=shard_ids,
+            shard_count=shard_count or self.config.shard_count or None
         )
+        startup_profiler.record("bot init", time.perf_counter() - self._init_started)
 
     async def setup_hook(self) -> None:
         """Initialize bot setup."""
         logger.info("Starting bot setup...")
         try:
+            # Only the series list is read here; characters are indexed in the background
+            with startup_profiler.phase("character data load"):
+                registry = get_registry()
+
+            self.job_queue.start()
+
             # Load cogs first
-            await self._load_cogs()
+            with startup_profiler.phase("cogs"):
+                await self._load_cogs()
             logger.info("Cogs loaded successfully!")
 
-            # Wait a moment before syncing commands
-            await asyncio.sleep(1)
+            self._registry_warm_task = asyncio.create_task(self._warm_registry(registry))
+
+            if self.config.character_data_watch:
+                self._character_watch_task = asyncio.create_task(self._watch_character_data())
 
-            # Now sync commands
-            logger.info("Syncing commands...")
-            await self.tree.sync()
-            logger.info("Commands synced successfully!")
+            # Only talk to the command API if the tree differs from the last sync
+            logger.info("Checking whether commands need syncing...")
+            with startup_profiler.phase("command sync"):
+                await self.sync_commands()
+            self._setup_finished = time.perf_counter()
         except Exception as e:
             logger.error(f"Setup failed: {e}")
             raise
 
+    async def sync_commands(
+            self,
+            guild: Optional[discord.abc.Snowflake] = None,
+            force: bool = False
+    ) -> Optional[List[app_commands.AppCommand]]:
+        """Sync the command tree for a scope, skipping it when its hash is unchanged"""
+        if not force and not self.is_primary_cluster:
+            # Commands are global to the application, so one cluster syncing is enough
+            logger.info(f"Cluster {self.cluster_id} leaves command sync to cluster 0")
+            return None
+        return await sync_if_changed(self.tree, self.command_sync_state, guild=guild, force=force)
+
+    @property
+    def is_primary_cluster(self) -> bool:
+        """Whether this process does the once-per-application work, like command sync"""
+        return not self.cluster_id
+
+    async def reload_characters(self) -> Tuple[int, bool]:
+        """Rebuild the character registry from its data file and swap it in
+
+        Interactions already running keep the registry they started with.
+        Slash commands are only re-synced when a series choice list changed,
+        since character names come from autocomplete rather than the tree.
+        Returns the character count and whether commands were re-synced.
+        """
+        async with self._registry_lock:
+            registry = await asyncio.to_thread(lambda: build_registry().ensure_built().build_autocomplete())
+            previous = set_registry(registry)
+            choices_changed = previous is None or previous.series_display_names != registry.series_display_names
+
+            for cog in self.cogs.values():
+                apply_registry = getattr(cog, 'apply_registry', None)
+                if apply_registry is not None:
+                    apply_registry(registry, choices_changed)
+
+            if choices_changed:
+                logger.info("Series choices changed, syncing commands...")
+                await self.sync_commands()
+            logger.info(f"Reloaded character registry: {len(registry.characters)} characters")
+            return len(registry.characters), choices_changed
+
+    async def _watch_character_data(self) -> None:
+        """Reload the character registry whenever its data file changes"""
+        path = data_file_path()
+
+        def signature() -> Optional[Tuple[int, int]]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                return None
+            return stat.st_size, stat.st_mtime_ns
+
+        last = signature()
+        while True:
+            await asyncio.sleep(self.config.character_data_poll_interval)
+            current = signature()
+            if current == last or current is None:
+                continue
+            # Wait for the writer to finish before reading the file
+            await asyncio.sleep(self.config.character_data_poll_interval)
+            if signature() != current:
+                continue
+            last = current
+            logger.info(f"{path} changed, reloading characters")
+            try:
+                await self.reload_characters()
+            except Exception as e:
+                logger.error(f"Failed to reload characters, keeping the current registry: {e}")
+
     def _load_cog_list(self) -> List[str]:
         """Load list of cogs from the cogs directory."""
         try:
@@ -102,25 +255,43 @@ class HentaiBot(commands.Bot):
         return commands.when_mentioned_or(*base)(bot, message)
 
     async def _load_cogs(self) -> None:
-        """Load all cogs from the cogs directory."""
-        for cog in self._cogs:
-            try:
-                if not cog.startswith('__'):  # Skip __init__.py and similar files
-                    await self.load_extension(f"bot.cogs.{cog}")
-                    logger.info(f"Loaded cog: {cog}")
-            except Exception as e:
-                logger.error(f"Failed to load cog {cog}: {e}")
+        """Load all cogs from the cogs directory concurrently."""
+        # Cogs don't depend on each other; shared state lives on the bot and in the registry
+        await asyncio.gather(*(
+            self._load_cog(cog) for cog in self._cogs
+            if not cog.startswith('__')  # Skip __init__.py and similar files
+        ))
+
+    async def _load_cog(self, cog: str) -> None:
+        """Load one cog, logging rather than raising so the others still load."""
+        try:
+            # Cogs load side by side inside the "cogs" phase
+            with startup_profiler.phase(f"cog {cog}", concurrent=True):
+                await self.load_extension(f"bot.cogs.{cog}")
+            logger.info(f"Loaded cog: {cog}")
+        except Exception as e:
+            logger.error(f"Failed to load cog {cog}: {e}")
+
+    async def _warm_registry(self, registry: CharacterRegistry) -> None:
+        """Index every character and build autocomplete off the event loop so commands don't pay for it"""
+        started = time.perf_counter()
+        try:
+            # Runs alongside command sync and the gateway connect
+            with startup_profiler.phase("registry build", concurrent=True):
+                await asyncio.to_thread(registry.ensure_built)
+            with startup_profiler.phase("autocomplete build", concurrent=True):
+                await asyncio.to_thread(registry.build_autocomplete)
+        except Exception as e:
+            logger.error(f"Failed to build character registry: {e}", exc_info=True)
+            return
+        logger.info(f"Character registry ready in {time.perf_counter() - started:.2f}s")
 
     async def start(self) -> None:
         """Start the bot with error handling."""
         try:
             logger.info("Starting bot...")
-            # Login first
+            # Commands are synced in setup_hook; start() only returns once the bot closes
             await super().start(self.config.token, reconnect=True)
-            # Then sync commands
-            logger.info("Syncing commands...")
-            await self.tree.sync()
-            logger.info("Commands synced!")
         except Exception as e:
             logger.error(f"Failed to start bot: {e}")
             raise
@@ -129,13 +300,39 @@ class HentaiBot(commands.Bot):
         """Cleanup and close the bot connection."""
         logger.info("Shutting down bot...")
         try:
-            await super().close()
+            for task in (self._character_watch_task, self._registry_warm_task):
+                if task is not None:
+                    task.cancel()
+            # AutoShardedClient.close signals the shard queue that connect() creates
+            if getattr(self, '_AutoShardedClient__queue', None) is not None:
+                await super().close()
+            else:
+                logger.info("Closing before connecting to the gateway")
+                await self._close_unconnected()
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
             raise
         finally:
+            # Our own workers must stop even if discord.py's shutdown failed
+            await self.job_queue.close()
+            self.io_pool.shutdown()
+            self.transcoder.shutdown()
             logger.info("Shutdown complete")
 
+    async def _close_unconnected(self) -> None:
+        """Do the parts of Bot.close that don't need a gateway connection"""
+        for extension in tuple(self.extensions):
+            try:
+                await self.unload_extension(extension)
+            except Exception as e:
+                logger.error(f"Failed to unload {extension}: {e}")
+        for cog in tuple(self.cogs):
+            try:
+                await self.remove_cog(cog)
+            except Exception as e:
+                logger.error(f"Failed to remove cog {cog}: {e}")
+        await self.http.close()
+
     # Event handlers
     async def on_ready(self) -> None:
         """Handle bot ready event."""
@@ -151,9 +348,22 @@ class HentaiBot(commands.Bot):
             status=discord.Status.online
         )
 
-        logger.info(f"Bot ready - Logged in as {self.user} (ID: {self.user.id})")
+        cluster = f" cluster {self.cluster_id}" if self.cluster_id is not None else ""
+        logger.info(
+            f"Bot ready{cluster} - Logged in as {self.user} (ID: {self.user.id}), "
+            f"shards {sorted(self.shards)} of {self.shard_count}, {len(self.guilds)} guilds"
+        )
         logger.info("Slash commands should be available now!")
 
+        if not startup_profiler.finished:
+            # on_ready fires again after reconnects; only the first one ends startup
+            startup_profiler.record("gateway ready", time.perf_counter() - self._setup_finished)
+            startup_profiler.finish()
+            if not startup_profiler.check_budget(self.config.startup_budget) and self.config.startup_budget_strict:
+                self.startup_budget_exceeded = True
+                logger.critical("Shutting down because startup exceeded its budget")
+                await self.close()
+
     async def on_connect(self) -> None:
         """Handle bot connect event."""
         logger.info(f"Connected to Discord (latency: {self.latency * 1000:.0f}ms)")
@@ -166,6 +376,15 @@ class HentaiBot(commands.Bot):
         """Handle bot resume event."""
         logger.info("Resumed Discord connection")
 
+    async def on_shard_ready(self, shard_id: int) -> None:
+        logger.info(f"Shard {shard_id} ready")
+
+    async def on_shard_disconnect(self, shard_id: int) -> None:
+        logger.warning(f"Shard {shard_id} disconnected from Discord")
+
+    async def on_shard_resumed(self, shard_id: int) -> None:
+        logger.info(f"Shard {shard_id} resumed")
+
     # Error handling
     async def _handle_app_command_error(
             self,
@@ -215,58 +434,3 @@ class HentaiBot(commands.Bot):
             f"An error occurred: {error_msg}",
             delete_after=10
         )
-
-        # Add these new command methods
-
-    @commands.is_owner()
-    @commands.command(name='sync')
-    async def sync(self, ctx: commands.Context):
-        """Sync all slash commands"""
-        try:
-            logger.info("Syncing commands...")
-            synced = await self.tree.sync()
-            logger.info(f"Synced {len(synced)} commands")
-            await ctx.send(f"Synced {len(synced)} commands")
-        except Exception as e:
-            logger.error(f"Failed to sync commands: {e}")
-            await ctx.send(f"Failed to sync commands: {e}")
-
-    @commands.is_owner()
-    @commands.command(name='sync_guild')
-    async def sync_guild(self, ctx: commands.Context):
-        """Sync commands to the current guild"""
-        try:
-            logger.info(f"Syncing commands to guild {ctx.guild.id}")
-            self.tree.copy_global_to(guild=ctx.guild)
-            synced = await self.tree.sync(guild=ctx.guild)
-            logger.info(f"Synced {len(synced)} commands to guild")
-            await ctx.send(f"Synced {len(synced)} commands to this guild")
-        except Exception as e:
-            logger.error(f"Failed to sync commands to guild: {e}")
-            await ctx.send(f"Failed to sync commands to guild: {e}")
-
-    @commands.is_owner()
-    @commands.command(name='clear_commands')
-    async def clear_commands(self, ctx: commands.Context):
-        """Clear all global commands"""
-        try:
-            logger.info("Clearing global commands...")
-            self.tree.clear_commands(guild=None)
-            await self.tree.sync()
-            await ctx.send("Cleared all global commands")
-        except Exception as e:
-            logger.error(f"Failed to clear commands: {e}")
-            await ctx.send(f"Failed to clear commands: {e}")
-
-    @commands.is_owner()
-    @commands.command(name='clear_guild_commands')
-    async def clear_guild_commands(self, ctx: commands.Context):
-        """Clear all guild commands"""
-        try:
-            logger.info(f"Clearing commands from guild {ctx.guild.id}")
-            self.tree.clear_commands(guild=ctx.guild)
-            await self.tree.sync(guild=ctx.guild)
-            await ctx.send("Cleared all guild commands")
-        except Exception as e:
-            logger.error(f"Failed to clear guild commands: {e}")
-            await ctx.send(f"Failed to clear guild commands: {e}")
\ No newline at end of file
@@ -0,0 +1,124 @@
+import logging
+
+from discord.ext import commands
+
+logger = logging.getLogger('AdminCog')
+
+
+class AdminCog(commands.Cog, name="Admin Commands"):
+    """Owner-only maintenance commands
+
+    Prefix commands are only registered from cogs, so these live here
+    rather than on the bot class. They work on state the bot owns.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_check(self, ctx: commands.Context) -> bool:
+        return await self.bot.is_owner(ctx.author)
+
+    @commands.command(name='cache_stats')
+    async def cache_stats(self, ctx: commands.Context):
+        """Show media cache hit rates and byte counters"""
+        byte_stats = self.bot.byte_cache.stats()
+        cdn_stats = self.bot.cdn_cache.stats()
+        upload_stats = self.bot.upload_scheduler.stats()
+        job_stats = self.bot.job_queue.stats()
+        stages = ", ".join(
+            f"{name} {stage['avg'] * 1000:.0f}/{stage['max'] * 1000:.0f} ms"
+            for name, stage in job_stats['stages'].items()
+        )
+        await ctx.send(
+            f"**Byte cache:** {byte_stats['entries']} files, "
+            f"{byte_stats['current_bytes'] / 1024 / 1024:.1f}/{byte_stats['max_bytes'] / 1024 / 1024:.0f} MiB, "
+            f"hit rate {byte_stats['hit_rate']:.1%}, "
+            f"{byte_stats['bytes_served'] / 1024 / 1024:.1f} MiB served from memory, "
+            f"{byte_stats['bytes_loaded'] / 1024 / 1024:.1f} MiB read from disk\n"
+            f"**CDN URL cache:** {cdn_stats['entries']} URLs, "
+            f"{cdn_stats['hits']} hits, {cdn_stats['misses']} misses, {cdn_stats['expired']} expired\n"
+            f"**Uploads:** {upload_stats['in_flight']}/{upload_stats['max_concurrent']} sending, "
+            f"{upload_stats['queue_depth']}/{upload_stats['max_queue']} queued, "
+            f"{upload_stats['started']} started, {upload_stats['rejected']} rejected, "
+            f"{upload_stats['timed_out']} timed out, avg wait {upload_stats['avg_wait']:.2f}s\n"
+            f"**Jobs:** {job_stats['busy']}/{job_stats['workers']} workers busy, "
+            f"{job_stats['depth']}/{job_stats['max_depth']} queued, {job_stats['completed']} completed, "
+            f"{job_stats['failed']} failed, {job_stats['rejected']} rejected, {job_stats['timed_out']} timed out\n"
+            f"**Stages (avg/max):** {stages or 'none yet'}"
+        )
+
+    @commands.command(name='sync')
+    async def sync(self, ctx: commands.Context, force: bool = False):
+        """Sync all slash commands if they changed (pass 'force' to always sync)"""
+        try:
+            logger.info("Syncing commands...")
+            synced = await self.bot.sync_commands(force=force)
+            if synced is None:
+                await ctx.send("Skipped: commands are unchanged since the last sync, or another cluster syncs them")
+                return
+            logger.info(f"Synced {len(synced)} commands")
+            await ctx.send(f"Synced {len(synced)} commands")
+        except Exception as e:
+            logger.error(f"Failed to sync commands: {e}")
+            await ctx.send(f"Failed to sync commands: {e}")
+
+    @commands.guild_only()
+    @commands.command(name='sync_guild')
+    async def sync_guild(self, ctx: commands.Context, force: bool = False):
+        """Sync commands to the current guild if they changed (pass 'force' to always sync)"""
+        try:
+            logger.info(f"Syncing commands to guild {ctx.guild.id}")
+            self.bot.tree.copy_global_to(guild=ctx.guild)
+            synced = await self.bot.sync_commands(guild=ctx.guild, force=force)
+            if synced is None:
+                await ctx.send("Guild commands unchanged since the last sync, skipped")
+                return
+            logger.info(f"Synced {len(synced)} commands to guild")
+            await ctx.send(f"Synced {len(synced)} commands to this guild")
+        except Exception as e:
+            logger.error(f"Failed to sync commands to guild: {e}")
+            await ctx.send(f"Failed to sync commands to guild: {e}")
+
+    @commands.command(name='reload_characters')
+    async def reload_characters(self, ctx: commands.Context):
+        """Reload character data without restarting"""
+        try:
+            count, resynced = await self.bot.reload_characters()
+            await ctx.send(
+                f"Reloaded {count} characters"
+                + (" and re-synced commands" if resynced else ", command choices unchanged")
+            )
+        except Exception as e:
+            logger.error(f"Failed to reload characters: {e}")
+            await ctx.send(f"Failed to reload characters: {e}")
+
+    @commands.command(name='clear_commands')
+    async def clear_commands(self, ctx: commands.Context):
+        """Clear all global commands"""
+        try:
+            logger.info("Clearing global commands...")
+            self.bot.tree.clear_commands(guild=None)
+            await self.bot.sync_commands(force=True)
+            await ctx.send("Cleared all global commands")
+        except Exception as e:
+            logger.error(f"Failed to clear commands: {e}")
+            await ctx.send(f"Failed to clear commands: {e}")
+
+    @commands.guild_only()
+    @commands.command(name='clear_guild_commands')
+    async def clear_guild_commands(self, ctx: commands.Context):
+        """Clear all guild commands"""
+        try:
+            logger.info(f"Clearing commands from guild {ctx.guild.id}")
+            self.bot.tree.clear_commands(guild=ctx.guild)
+            await self.bot.sync_commands(guild=ctx.guild, force=True)
+            await ctx.send("Cleared all guild commands")
+        except Exception as e:
+            logger.error(f"Failed to clear guild commands: {e}")
+            await ctx.send(f"Failed to clear guild commands: {e}")
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Setup function to add cog to bot"""
+    await bot.add_cog(AdminCog(bot))
+    logger.info("Successfully loaded admin cog")
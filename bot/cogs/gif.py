@@ -1,14 +1,16 @@
 # bot/cogs/gif.py
-from typing import List
+from typing import List, Optional
 
 import discord
 from discord import app_commands, Interaction
 from discord.ext import commands
 import logging
 
-from .utils.base_cog import BaseAnimeCog
-from .utils.handlers import create_character_info
-from .utils.constants import CHARACTER_DESCRIPTIONS, CHARACTER_MAPPINGS
+from .utils.base_cog import MAX_GALLERY_COUNT, BaseAnimeCog
+from .utils.handlers import CharacterInfo
+from .utils.jobs import stage
+from .utils.registry import CharacterRegistry
+from .utils.transcode import ANIMATION_FORMATS
 
 logger = logging.getLogger('GifCogs')
 
@@ -16,65 +18,104 @@ logger = logging.getLogger('GifCogs')
 class GifCog(BaseAnimeCog):
     """Cog for animated GIF images"""
 
+    gif_variant = True
+
     def __init__(self, bot: commands.Bot):
         super().__init__(bot, "./hentai/gifs/")
-        self.load_gif_characters()
-        self.gif_group = app_commands.Group(
+        config = getattr(bot, 'config', None)
+        gif_format = config.gif_transcode_format if config else 'webp'
+        self.animation_format = gif_format if gif_format in ANIMATION_FORMATS else None
+        # GIFs share the registry's records; gif_variant changes how they are presented.
+        # Folders are relative to ./hentai/gifs/, i.e. <series>/<character>
+        self.gif_group = self._make_gif_group()
+        self.register_slash_commands()
+
+    @staticmethod
+    def _make_gif_group() -> app_commands.Group:
+        return app_commands.Group(
             name="gif",
             description="Get character GIFs"
         )
-        self.register_slash_commands()
 
-    def load_gif_characters(self):
-        """Load GIF versions of characters"""
-        for source, descriptions in CHARACTER_DESCRIPTIONS.items():
-            mapping_data = CHARACTER_MAPPINGS[source]
-            for char_id, desc_data in descriptions.items():
-                # Verify the character exists in both mappings and descriptions
-                if char_id in mapping_data:
-                    display_name, description = desc_data
-                    # Create GIF-specific description data
-                    gif_desc_data = (f"{display_name} GIF", f"Animated GIF - {description}")
-
-                    char_info = create_character_info(
-                        char_id=char_id,
-                        source=source,
-                        desc_data=gif_desc_data,
-                        mapping_data={
-                            char_id: [  # Create GIF-specific aliases
-                                f"gif_{char_id}",
-                                f"{char_id}-gif",
-                                *[f"{alias}_gif" for alias in mapping_data[char_id]]
-                            ]
-                        }
-                    )
-                    # Override the folder to use the gifs subdirectory
-                    char_info.folder = f"{source}/gifs/{char_id}"
-                    self.characters[char_id] = char_info
-                else:
-                    logger.warning(f"Character {char_id} found in descriptions but not in mappings for {source}")
+    def apply_registry(self, registry: CharacterRegistry, choices_changed: bool) -> None:
+        """Switch to a reloaded registry, rebuilding the GIF command if its choices changed"""
+        self.registry = registry
+        if choices_changed:
+            self.bot.tree.remove_command(self.gif_group.name)
+            self.gif_group = self._make_gif_group()
+            self.register_slash_commands()
+            self.bot.tree.add_command(self.gif_group)
+
+    def get_characters_for_series(self, series: str) -> List[CharacterInfo]:
+        """Get all GIF characters for a series"""
+        return self.registry.get_characters_for_series(series)
+
+    def find_character(self, series: str, character_name: str,
+                       registry: Optional[CharacterRegistry] = None) -> Optional[CharacterInfo]:
+        """Find a GIF character by id, title or alias, with or without a gif suffix"""
+        normalized_name = character_name.lower().strip()
+        for suffix in (' gif', '_gif', '-gif'):
+            if normalized_name.endswith(suffix):
+                normalized_name = normalized_name[:-len(suffix)]
+                break
+        if normalized_name.startswith('gif_'):
+            normalized_name = normalized_name[len('gif_'):]
+
+        return (registry or self.registry).find_character(series, normalized_name)
 
     def register_slash_commands(self):
         """Register slash commands for all GIF characters"""
         series_choices = [
-            app_commands.Choice(name=name.replace('_', ' ').title(), value=name)
-            for name in CHARACTER_DESCRIPTIONS.keys()
+            app_commands.Choice(name=display_name, value=value)
+            for value, display_name in self.registry.series_display_names.items()
         ]
 
         @self.gif_group.command(name="show")
         @app_commands.describe(
             series="Choose a series",
-            character_name="Choose or type the character's name"
+            character_name="Choose or type the character's name",
+            count=f"Optional: How many GIFs to send (up to {MAX_GALLERY_COUNT})"
         )
         @app_commands.choices(series=series_choices)
         async def gif_command(
                 interaction: Interaction,
                 series: str,
-                character_name: str
+                character_name: str,
+                count: app_commands.Range[int, 1, MAX_GALLERY_COUNT] = 1
         ):
             """Get a character GIF from a specific series"""
-            # Rest of the command implementation remains the same...
-            # [Previous implementation]
+            try:
+                if not self.is_warm:
+                    await self.send_warming_up(interaction)
+                    return
+
+                # The job may run after a reload; resolve against the registry that accepted the command
+                registry = self.registry
+
+                async def show():
+                    with stage('lookup'):
+                        character = self.find_character(series, character_name, registry)
+
+                    if character is None:
+                        await interaction.followup.send(
+                            f"Character '{character_name}' not found in {series}.",
+                            ephemeral=True
+                        )
+                        return
+
+                    await self.send_character_gallery(interaction, character, count, already_deferred=True)
+
+                await self.run_job(interaction, 'gif show', show)
+
+            except Exception as e:
+                logger.exception(f"Error in gif command: {str(e)}")
+                try:
+                    await interaction.followup.send(
+                        "An error occurred while processing your request.",
+                        ephemeral=True
+                    )
+                except discord.NotFound:
+                    logger.error("Could not send error message - interaction may have expired")
 
         # Fixed autocomplete implementation
         @gif_command.autocomplete('character_name')
@@ -83,20 +124,12 @@ class GifCog(BaseAnimeCog):
                 current: str,
         ) -> List[app_commands.Choice[str]]:
             try:
-                # Correctly access the options from interaction data
-                options = interaction.data.get('options', [])
-                selected_series = None
-
-                # Iterate through options to find series
-                for option in options:
-                    if isinstance(option, dict) and option.get('name') == 'series':
-                        selected_series = option.get('value')
-                        break
-
-                if not selected_series:
+                selected_series = interaction.namespace.series
+                if not selected_series or not self.registry.autocomplete_ready:
                     return []
 
-                return await self.get_character_autocomplete(interaction, current, selected_series)
+                engine = self.registry.autocomplete(selected_series)
+                return engine.search(current) if engine else []
 
             except Exception as e:
                 logger.error(f"Error in character autocomplete: {e}")
@@ -4,8 +4,9 @@ import discord
 import logging
 import random
 from typing import Dict, List, Tuple, Optional, Literal
-from .utils.constants import CHARACTER_DESCRIPTIONS, CHARACTER_MAPPINGS
 from .utils.handlers import CharacterInfo, ImageHandler  # Add this import
+from .utils.base_cog import WARMING_UP_MESSAGE
+from .utils.registry import CharacterRegistry, get_registry
 
 logger = logging.getLogger('HelpCog')
 
@@ -17,6 +18,7 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.registry = get_registry()
         # self.image_handler = ImageHandler("./hentai")  # Add this
         self.series_group = app_commands.Group(
             name="series",
@@ -25,6 +27,10 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
         self.setup_series_commands()
         # self.setup_random_command()  # Add this line
 
+    def apply_registry(self, registry: CharacterRegistry, choices_changed: bool) -> None:
+        """Switch to a reloaded registry"""
+        self.registry = registry
+
     def setup_series_commands(self):
         """Setup all series-related commands"""
         @self.series_group.command(name="list")
@@ -35,9 +41,9 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
                 description="Use `/series show <name> [page]` to see characters from a specific series\n"
                            "For example: `/series show one_piece 1`\n\n"
                            "**Commands Format:**\n"
-                           "• `/character show <series> <character>` - Get a character image\n"
-                           "• `/gif show <series> <character>` - Get an animated GIF\n\n"
-                           "Example: `/character show one_piece nami`",
+                           "• `/character show <character> [series] [count]` - Get one or more character images\n"
+                           "• `/gif show <series> <character> [count]` - Get one or more animated GIFs\n\n"
+                           "Example: `/character show nami one_piece`",
                 color=discord.Color.blue()
             )
 
@@ -113,9 +119,9 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
             description="Use `/series show <name> [page]` to see characters from a specific series\n"
                         "For example: `/series show one_piece 1`\n\n"
                         "**Commands Format:**\n"
-                        "• `/character show <series> <character>` - Get a character image\n"
-                        "• `/gif show <series> <character>` - Get an animated GIF\n\n"
-                        "Example: `/character show one_piece nami`",
+                        "• `/character show <character> [series] [count]` - Get one or more character images\n"
+                        "• `/gif show <series> <character> [count]` - Get one or more animated GIFs\n\n"
+                        "Example: `/character show nami one_piece`",
             color=discord.Color.blue()
         )
 
@@ -155,19 +161,14 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
 
     async def _get_paginated_chars(self, series_id: str, page: int) -> Tuple[List[Tuple[str, Tuple[str, str]]], int]:
         """Get paginated characters and total pages"""
-        char_mappings = CHARACTER_MAPPINGS.get(series_id, {})
-        char_descriptions = CHARACTER_DESCRIPTIONS.get(series_id, {})
-
+        # Registry characters are already sorted by title
         char_items = []
-        for char_id, aliases in char_mappings.items():
-            if char_id in char_descriptions:
-                name, description = char_descriptions[char_id]
-                alias_list = [a for a in aliases if a != char_id and not a.endswith('_(cosplay)')]
-                if alias_list:
-                    description = f"{description}\nAliases: {', '.join(alias_list)}"
-                char_items.append((char_id, (name, description)))
-
-        char_items.sort(key=lambda x: x[1][0])
+        for char in self.registry.get_characters_for_series(series_id):
+            description = char.description
+            alias_list = [a for a in char.aliases if a != char.name and not a.endswith('_(cosplay)')]
+            if alias_list:
+                description = f"{description}\nAliases: {', '.join(alias_list)}"
+            char_items.append((char.name, (char.title, description)))
 
         total_pages = (len(char_items) + CHARS_PER_PAGE - 1) // CHARS_PER_PAGE
         page = max(1, min(page, total_pages))
@@ -180,7 +181,12 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
     async def _send_series_help(self, interaction: discord.Interaction, series_id: str, series_name: str,
                                 page: int = 1):
         """Send paginated series help embed"""
-        chars = CHARACTER_MAPPINGS.get(series_id, {})
+        if not self.registry.ready:
+            # Listing characters would build the registry on the event loop
+            await interaction.response.send_message(WARMING_UP_MESSAGE, ephemeral=True)
+            return
+
+        chars = self.registry.get_characters_for_series(series_id)
         if not chars:
             await interaction.response.send_message(f"No characters found for {series_name}")
             return
@@ -191,7 +197,7 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
             title=f"{series_name} Characters (Page {page}/{total_pages})",
             description=f"List of available characters from {series_name}\n\n"
                         f"**How to use:**\n"
-                        f"• `/character show {series_id} <character>` - Get an image\n"
+                        f"• `/character show <character> {series_id}` - Get an image\n"
                         f"• `/gif show {series_id} <character>` - Get a GIF\n\n"
                         f"Use `/series show {series_id} <page>` to see other pages",
             color=discord.Color.blue()
@@ -201,7 +207,7 @@ class CharacterHelpCog(commands.Cog, name="Help Commands"):
             field_value = (
                 f"_{description}_\n\n"
                 f"**Example:**\n"
-                f"• `/character show {series_id} {char_id}`"
+                f"• `/character show {char_id} {series_id}`"
             )
             embed.add_field(
                 name=name,
@@ -0,0 +1,147 @@
+import heapq
+import logging
+import re
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from itertools import chain
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from discord import app_commands
+
+logger = logging.getLogger('Autocomplete')
+
+MAX_CHOICES = 25
+
+# Discord rejects choice names and values longer than this
+MAX_CHOICE_LENGTH = 100
+
+# Fuzzy matches below this trigram similarity are dropped
+MIN_SIMILARITY = 0.3
+
+# Terms sharing the most trigrams with a query that get a full similarity score
+FUZZY_CANDIDATES = 256
+
+# Trigrams found in more than 1/STOP_GRAM_FRACTION of all terms are ignored by fuzzy search
+STOP_GRAM_FRACTION = 50
+STOP_GRAM_MIN = 1000
+
+_SEPARATORS = re.compile(r'[\s_\-]+')
+
+
+def normalize_term(text: str) -> str:
+    """Lowercase a title or alias and collapse separators to single spaces"""
+    return _SEPARATORS.sub(' ', text.lower()).strip()
+
+
+def trigrams(term: str) -> List[str]:
+    padded = f"  {term} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class AutocompleteEngine:
+    """Ranked, typo-tolerant name completion over a fixed set of choices
+
+    Built once from (name, value, search terms) entries. Queries are
+    answered from sorted term arrays (a flattened prefix trie) and only
+    fall back to a trigram index when there aren't enough prefix hits.
+    Choice objects are created up front and shared between responses.
+
+    Ranking: whole-term prefix matches, then matches at the start of a
+    later word. Fuzzy matches by trigram similarity are only offered
+    when nothing matches as a prefix, which is when the user mistyped.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, Sequence[str]]], cache_size: int = 1024):
+        self.choices: List[app_commands.Choice[str]] = []
+        full_terms: List[Tuple[str, int]] = []
+        word_terms: List[Tuple[str, int]] = []
+        self._fuzzy_terms: List[Tuple[int, int]] = []  # (entry, trigram count)
+        self._trigrams: Dict[str, List[int]] = {}
+
+        for entry_id, (name, value, terms) in enumerate(sorted(entries, key=lambda e: e[0].lower())):
+            self.choices.append(app_commands.Choice(
+                name=name[:MAX_CHOICE_LENGTH], value=value[:MAX_CHOICE_LENGTH]))
+            for term in dict.fromkeys(normalize_term(t) for t in (name, *terms)):
+                if not term:
+                    continue
+                full_terms.append((term, entry_id))
+                for match in re.finditer(' ', term):
+                    word_terms.append((term[match.end():], entry_id))
+
+                # Single words are indexed too so a typo in one word of a long name still matches
+                words = term.split(' ')
+                for fuzzy_term in (term, *words) if len(words) > 1 else (term,):
+                    grams = set(trigrams(fuzzy_term))
+                    term_id = len(self._fuzzy_terms)
+                    self._fuzzy_terms.append((entry_id, len(grams)))
+                    for gram in grams:
+                        self._trigrams.setdefault(gram, []).append(term_id)
+
+        full_terms.sort()
+        word_terms.sort()
+        self._full_keys = [term for term, _ in full_terms]
+        self._full_ids = [entry_id for _, entry_id in full_terms]
+        self._word_keys = [term for term, _ in word_terms]
+        self._word_ids = [entry_id for _, entry_id in word_terms]
+
+        self._cache: 'OrderedDict[str, List[app_commands.Choice[str]]]' = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> List[app_commands.Choice[str]]:
+        """Get up to limit ranked choices for what the user has typed so far"""
+        query = normalize_term(query)
+        if not query:
+            return self.choices[:limit]
+
+        cache_key = f"{limit}:{query}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        found: Dict[int, None] = {}
+        self._scan_prefix(self._full_keys, self._full_ids, query, found, limit)
+        if len(found) < limit:
+            self._scan_prefix(self._word_keys, self._word_ids, query, found, limit)
+        if not found and len(query) >= 3:
+            self._fuzzy(query, found, limit)
+
+        result = [self.choices[entry_id] for entry_id in found]
+        self._cache[cache_key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _scan_prefix(keys: List[str], ids: List[int], query: str, found: Dict[int, None], limit: int) -> None:
+        i = bisect_left(keys, query)
+        while i < len(keys) and len(found) < limit and keys[i].startswith(query):
+            found.setdefault(ids[i])
+            i += 1
+
+    def _fuzzy(self, query: str, found: Dict[int, None], limit: int) -> None:
+        query_grams = set(trigrams(query))
+        postings = sorted((self._trigrams.get(gram, ()) for gram in query_grams), key=len)
+        # Very common trigrams say little about a match but dominate the cost, so skip them
+        stop_size = max(STOP_GRAM_MIN, len(self._fuzzy_terms) // STOP_GRAM_FRACTION)
+        selected = [p for p in postings if len(p) <= stop_size]
+        if not any(selected):
+            # Only common trigrams matched anything: fall back to the two rarest of them
+            selected += [p for p in postings if len(p) > stop_size][:2]
+        coverage = len(selected) / len(query_grams)
+
+        # Counting and the top-k cut both run in C; only the best candidates are scored
+        shared = Counter(chain.from_iterable(selected))
+
+        best: Dict[int, float] = {}
+        for term_id, count in shared.most_common(FUZZY_CANDIDATES):
+            entry_id, term_grams = self._fuzzy_terms[term_id]
+            similarity = 2 * count / (len(selected) + term_grams * coverage)
+            if similarity >= MIN_SIMILARITY and entry_id not in found and similarity > best.get(entry_id, 0):
+                best[entry_id] = similarity
+
+        for entry_id in heapq.nlargest(limit - len(found), best, key=lambda e: (best[e], -e)):
+            found.setdefault(entry_id)
@@ -1,79 +1,718 @@
+import asyncio
+import io
+import re
+import time
+import weakref
+from pathlib import Path
+from urllib.parse import urlparse
+
 import discord
 from discord.ext import commands
 import logging
-from typing import Dict, Optional
+import sqlite3
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+from .cdn_cache import CdnUrlCache
+from .coalesce import RequestCoalescer
+from .content_store import ContentStore
 from .handlers import CharacterInfo, ImageHandler
+from .io_pool import IOPoolSaturated
+from .jobs import Job, JobQueue, JobQueueFull, stage
+from .phash import PerceptualHashStore
+from .prefetch import ImagePrefetcher
+from .registry import CharacterRegistry, get_registry
+from .media_catalog import MediaCatalog
+from .transcode import VARIANT_TIERS, MediaTooLarge, MediaTranscoder
+from .upload_scheduler import UploadQueueFull, UploadScheduler
 
 logger = logging.getLogger('AnimeBaseCog')
 
+DEFAULT_UPLOAD_LIMIT = 10 * 1024 * 1024
+
+VIDEO_SUFFIXES = ('.mp4', '.webm')
+
+# Discord allows this many attachments, and this many embeds, per message
+MAX_ATTACHMENTS = 10
+
+# Most images a single gallery request may ask for
+MAX_GALLERY_COUNT = 30
+
+# Interaction tokens stop working after 15 minutes, so jobs are cancelled just before that
+JOB_TIMEOUT = 14 * 60.0
+
+# How long a coalesced request waits for the first request's upload before uploading itself
+SHARED_UPLOAD_WAIT = 30.0
+
+WARMING_UP_MESSAGE = "The bot is still warming up, please try again in a few seconds."
+BUSY_MESSAGE = "The bot is busy right now, please try again in a moment."
+TIMED_OUT_MESSAGE = "That took too long and was cancelled, please try again."
+
+
+def attachment_filename(filename: str) -> str:
+    """Make a filename safe to reference as attachment:// in an embed"""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', filename)
+
+
+def upload_limit(interaction: discord.Interaction) -> int:
+    """Get the attachment size limit for where an interaction was used"""
+    limit = getattr(interaction, 'attachment_size_limit', None)
+    if limit:
+        return limit
+    if interaction.guild is not None:
+        return interaction.guild.filesize_limit
+    return DEFAULT_UPLOAD_LIMIT
+
+
+def is_video(filename: str) -> bool:
+    """Check whether a file name or URL path points at a video"""
+    return filename.lower().endswith(VIDEO_SUFFIXES)
+
+
+class SharedPick:
+    """An image picked for one request, shared with identical requests in the coalescing window"""
+
+    __slots__ = ('filename', 'file_path', 'content_hash', 'data', 'uploaded')
+
+    def __init__(self, filename: str, file_path: Path, content_hash: str, data: Optional[bytes]):
+        self.filename = filename
+        self.file_path = file_path
+        self.content_hash = content_hash
+        self.data = data
+        # Resolves to (CDN URL, cache key) of the first upload, or None if nobody managed one
+        self.uploaded: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def publish(self, upload: Optional[Tuple[str, str]]) -> None:
+        if not self.uploaded.done():
+            self.uploaded.set_result(upload)
+
+    async def wait_uploaded(self, timeout: float) -> Optional[Tuple[str, str]]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.uploaded), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class GalleryItem(NamedTuple):
+    """One image of a gallery, either already on Discord's CDN or ready to upload"""
+    filename: str
+    file_path: Path
+    content_hash: str
+    cache_key: str  # Key of the bytes uploaded, or of the earlier upload cdn_url points at
+    cdn_url: Optional[str]
+    data: bytes
+
+
+def pack_gallery(items: List[GalleryItem], max_bytes: int) -> List[List[GalleryItem]]:
+    """Split items into as few messages as fit the attachment count and upload size limits
+
+    First-fit decreasing by upload size; images already on the CDN take
+    an embed slot but no upload bytes.
+    """
+    batches: List[List[GalleryItem]] = []
+    batch_bytes: List[int] = []
+    for item in sorted(items, key=lambda i: len(i.data), reverse=True):
+        for i, batch in enumerate(batches):
+            if len(batch) < MAX_ATTACHMENTS and batch_bytes[i] + len(item.data) <= max_bytes:
+                batch.append(item)
+                batch_bytes[i] += len(item.data)
+                break
+        else:
+            batches.append([item])
+            batch_bytes.append(len(item.data))
+    return batches
+
 
 class BaseAnimeCog(commands.Cog):
     """Base cog for anime image commands"""
 
+    # Set by cogs that serve GIFs to re-encode them as 'webp' or 'mp4'
+    animation_format: Optional[str] = None
+
+    # Set by cogs that serve the GIF variant of the shared character records
+    gif_variant: bool = False
+
     def __init__(self, bot: commands.Bot, root_dir: str):
         self.bot = bot
-        self.image_handler = ImageHandler(root_dir)
-        self.characters: Dict[str, CharacterInfo] = {}
+        self.image_handler = ImageHandler(
+            root_dir,
+            catalog=self._open_catalog(),
+            io_pool=getattr(bot, 'io_pool', None),
+            byte_cache=getattr(bot, 'byte_cache', None),
+            content_store=self._open_content_store()
+        )
+        self.cdn_cache: CdnUrlCache = getattr(bot, 'cdn_cache', None) or CdnUrlCache()
+        self.upload_scheduler: UploadScheduler = getattr(bot, 'upload_scheduler', None) or UploadScheduler()
+        config = getattr(bot, 'config', None)
+        self.coalescer = RequestCoalescer(window=config.coalesce_window if config else 1.0)
+        self.prefetcher = ImagePrefetcher(
+            self.image_handler,
+            max_bytes=config.prefetch_bytes if config else 64 * 1024 * 1024
+        )
+        self.transcoder: Optional[MediaTranscoder] = getattr(bot, 'transcoder', None)
+        self.registry: CharacterRegistry = get_registry()
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._warm_task: Optional[asyncio.Task] = None
+        # Jobs drop out of this once the queue lets go of them
+        self._jobs: 'weakref.WeakSet[Job]' = weakref.WeakSet()
+
+    @property
+    def characters(self) -> Dict[str, CharacterInfo]:
+        """Characters keyed by unique id, shared with every other cog through the registry"""
+        return self.registry.characters
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the media index and character registry are built"""
+        return self.image_handler.ready and self.registry.ready
+
+    async def send_warming_up(self, interaction: discord.Interaction) -> None:
+        """Answer straight away instead of blocking on a build that hasn't finished"""
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(WARMING_UP_MESSAGE, ephemeral=True)
+            else:
+                await interaction.response.send_message(WARMING_UP_MESSAGE, ephemeral=True)
+        except discord.NotFound:
+            logger.error("Could not send warming up message - interaction expired")
+
+    async def run_job(self, interaction: discord.Interaction, name: str,
+                      work: Callable[[], Awaitable[None]]) -> None:
+        """Acknowledge the interaction now and leave the slow part to the bot's job queue"""
+        job_queue: Optional[JobQueue] = getattr(self.bot, 'job_queue', None)
+        if job_queue is not None and job_queue.saturated:
+            await self.send_busy(interaction)
+            return
+
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        if job_queue is None or not job_queue.running:
+            await work()
+            return
+        try:
+            job = job_queue.submit(
+                work, name=name, timeout=JOB_TIMEOUT,
+                on_timeout=lambda: self.send_timed_out(interaction)
+            )
+        except JobQueueFull:
+            await self.send_busy(interaction)
+            return
+        self._jobs.add(job)
+
+    async def send_timed_out(self, interaction: discord.Interaction) -> None:
+        try:
+            await interaction.followup.send(TIMED_OUT_MESSAGE, ephemeral=True)
+        except discord.HTTPException:
+            logger.error("Could not send timeout message - interaction expired")
+
+    async def send_busy(self, interaction: discord.Interaction) -> None:
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(BUSY_MESSAGE, ephemeral=True)
+            else:
+                await interaction.response.send_message(BUSY_MESSAGE, ephemeral=True)
+        except discord.NotFound:
+            logger.error("Could not send busy message - interaction expired")
+
+    def _open_catalog(self) -> Optional[MediaCatalog]:
+        """Open the persistent media catalog configured on the bot, if any"""
+        config = getattr(self.bot, 'config', None)
+        if config is None or not config.media_catalog_path:
+            return None
+        try:
+            return MediaCatalog.shared(config.media_catalog_path)
+        except sqlite3.Error as e:
+            logger.error(f"Could not open media catalog {config.media_catalog_path}: {e}")
+            return None
+
+    def _open_content_store(self) -> Optional[ContentStore]:
+        """Open the content-addressed store if the media tree was migrated to one"""
+        config = getattr(self.bot, 'config', None)
+        if config is None or not config.media_cas_dir:
+            return None
+        store = ContentStore(config.media_cas_dir)
+        return store if store.exists else None
+
+    def _load_duplicate_clusters(self) -> None:
+        """Load near-duplicate clusters found by tools/find_duplicates.py, if any"""
+        config = getattr(self.bot, 'config', None)
+        if config is None or not config.media_catalog_path:
+            return
+        try:
+            store = PerceptualHashStore(config.media_catalog_path)
+            clusters = store.load_clusters(self.image_handler.root_dir)
+        except sqlite3.Error as e:
+            logger.error(f"Could not load duplicate clusters: {e}")
+            return
+        if clusters:
+            self.image_handler.index.set_clusters(clusters)
+
+    async def cog_load(self) -> None:
+        """Start building the media index in the background once the cog is added"""
+        self._warm_up_task = asyncio.create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        """Build the media index, then start watching the tree and warming size variants"""
+        started = time.perf_counter()
+        try:
+            await self.image_handler.warm_up()
+            await asyncio.to_thread(self._load_duplicate_clusters)
+        except Exception as e:
+            logger.error(f"Failed to build media index for {self.image_handler.root_dir}: {e}", exc_info=True)
+            return
+        logger.info(f"{type(self).__name__} media index ready in {time.perf_counter() - started:.2f}s")
+
+        config = getattr(self.bot, 'config', None)
+        if config is None or config.media_watch:
+            self.image_handler.start_watching(
+                poll_interval=config.media_poll_interval if config else 5.0
+            )
+        if self.transcoder is not None and self.transcoder.enabled:
+            self._warm_task = asyncio.create_task(self._warm_variants())
+
+    async def cog_unload(self) -> None:
+        """Stop the media watcher and background work when the cog is removed"""
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+        self.image_handler.stop_watching()
+        self.prefetcher.cancel_all()
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+        # Queued and running jobs belong to this cog's code, so they don't outlive it
+        for job in list(self._jobs):
+            job.cancel()
+
+    async def _warm_variants(self) -> None:
+        """Build size variants, then animation encodings, in the background"""
+        catalog = self.image_handler.index.catalog
+        if catalog is None:
+            logger.info("No media catalog, variants will be built on demand")
+            return
+        await self._warm_size_variants(catalog)
+        if self.animation_format is not None and self.transcoder.can_transcode(self.animation_format):
+            await self._warm_animations(catalog)
+
+    async def _warm_size_variants(self, catalog: MediaCatalog) -> None:
+        """Build variants for oversized files in the background so sends don't wait on them"""
+
+        limit = VARIANT_TIERS[0]
+        oversized = await self.image_handler.io_pool.run(
+            catalog.files_larger_than, self.image_handler.root_dir, limit
+        )
+        logger.info(f"Warming size variants for {len(oversized)} files over {limit} bytes")
+
+        built = 0
+        for file_path, _ in oversized:
+            try:
+                content_hash = await self.image_handler.content_hash(file_path)
+                if await self.transcoder.variant_for(file_path, content_hash, limit):
+                    built += 1
+            except IOPoolSaturated:
+                await asyncio.sleep(5)
+            except OSError as e:
+                logger.debug(f"Skipping variant for {file_path}: {e}")
+        logger.info(f"Size variants ready for {built}/{len(oversized)} oversized files")
+
+    async def _warm_animations(self, catalog: MediaCatalog) -> None:
+        """Encode GIFs as WebP/MP4 ahead of time, largest first, so sends can swap them in"""
+        gifs = await self.image_handler.io_pool.run(
+            catalog.files_with_extension, self.image_handler.root_dir, '.gif'
+        )
+        logger.info(f"Warming {self.animation_format} encodings for {len(gifs)} GIFs")
+
+        built = 0
+        for file_path, _ in gifs:
+            try:
+                content_hash = await self.image_handler.content_hash(file_path)
+                if await self.transcoder.animation_for(file_path, content_hash, self.animation_format):
+                    built += 1
+            except IOPoolSaturated:
+                await asyncio.sleep(5)
+            except OSError as e:
+                logger.debug(f"Skipping {self.animation_format} encoding for {file_path}: {e}")
+        logger.info(f"{self.animation_format} encodings ready for {built}/{len(gifs)} GIFs")
+
+    async def _smaller_animation(self, file_path, filename: str, content_hash: str,
+                                 data: bytes) -> Tuple[str, bytes, str]:
+        """Swap a GIF for its WebP/MP4 encoding when that is smaller, returning the cache key of what was picked"""
+        if (self.animation_format is None or self.transcoder is None
+                or not filename.lower().endswith('.gif')):
+            return filename, data, content_hash
+
+        encoded = self.transcoder.find_animation(content_hash, self.animation_format)
+        if encoded is None:
+            # Never hold a send on an encode; this one goes out as the GIF
+            self.transcoder.schedule_animation(file_path, content_hash, self.animation_format)
+            return filename, data, content_hash
+
+        encoded_key = MediaTranscoder.animation_name(content_hash, self.animation_format)
+        encoded_data = await self.image_handler.read_file(encoded, encoded_key)
+        if len(encoded_data) >= len(data):
+            return filename, data, content_hash
+        logger.debug(f"Serving {filename} as {encoded.suffix} ({len(data)} -> {len(encoded_data)} bytes)")
+        return f"{Path(filename).stem}{encoded.suffix}", encoded_data, encoded_key
+
+    async def _prepare_upload(self, interaction: discord.Interaction, file_path, filename: str,
+                              content_hash: str, data: bytes) -> Tuple[str, bytes, str]:
+        """Pick the smallest good encoding and make sure it fits this interaction's upload limit
+
+        Also returns the cache key of the bytes picked: the content hash
+        when the original goes out, otherwise the encoding's or variant's own key.
+        """
+        filename, data, cache_key = await self._smaller_animation(file_path, filename, content_hash, data)
+
+        limit = upload_limit(interaction)
+        if len(data) <= limit:
+            return filename, data, cache_key
+
+        variant = None
+        if self.transcoder is not None:
+            variant = await self.transcoder.variant_for(file_path, content_hash, limit)
+        if variant is None:
+            raise MediaTooLarge(f"{filename} is {len(data)} bytes, over the {limit} byte upload limit")
+
+        # Variant files are named after their key
+        variant_key = variant.stem
+        logger.debug(f"Using size variant {variant.name} for {filename}")
+        data = await self.image_handler.read_file(variant, variant_key)
+        return f"{Path(filename).stem}{variant.suffix}", data, variant_key
+
+    def _cdn_keys(self, content_hash: str, file_path, limit: int) -> List[str]:
+        """Cache keys of earlier uploads this cog may send for a file, best first
+
+        An upload of the original can be linked anywhere. A cog that
+        re-encodes GIFs prefers its own encoding; other cogs never get it.
+        A downscaled variant only stands in when the original is over this
+        upload limit.
+        """
+        keys = [content_hash]
+        if self.animation_format is not None:
+            keys.insert(0, MediaTranscoder.animation_name(content_hash, self.animation_format))
+        size = self.image_handler.known_size(file_path)
+        if size is not None and size > limit:
+            keys.extend(
+                MediaTranscoder.variant_key(content_hash, tier)
+                for tier in sorted({*VARIANT_TIERS, limit}, reverse=True) if tier <= limit
+            )
+        return keys
+
+    def _cached_upload(self, file_path, content_hash: str, limit: int) -> Tuple[Optional[str], Optional[str]]:
+        """Find an earlier upload of a file that can be sent here, as (CDN URL, cache key)"""
+        return self.cdn_cache.get_any(self._cdn_keys(content_hash, file_path, limit))
+
+    async def refresh_media_index(self, subfolder: Optional[str] = None) -> None:
+        """Rescan media on disk so new or removed files are picked up"""
+        await self.image_handler.refresh_async(subfolder)
+        logger.info(f"Media index refreshed for {subfolder or self.image_handler.root_dir}")
+
+    async def _upload_image(self, interaction: discord.Interaction, embed: discord.Embed, file_path, filename: str,
+                            content_hash: str, data: Optional[bytes] = None) -> Optional[Tuple[str, str]]:
+        """Upload an image inside the embed and remember its CDN URL for later sends
+
+        Returns the CDN URL and the cache key it was stored under.
+        """
+        if data is None:
+            data = await self.image_handler.read_file(file_path, content_hash)
+        filename, data, cache_key = await self._prepare_upload(interaction, file_path, filename, content_hash, data)
+        upload_name = attachment_filename(filename)
+        file = discord.File(io.BytesIO(data), filename=upload_name)
+        # Videos can't go inside an embed, Discord plays them as a plain attachment instead
+        if not is_video(upload_name):
+            embed.set_image(url=f"attachment://{upload_name}")
+
+        # Uploads in the same channel share a route; small files go first when slots are short
+        async with self.upload_scheduler.slot(interaction.channel_id, len(data)):
+            message = await interaction.followup.send(file=file, embed=embed, wait=True)
+        if message.attachments:
+            self.cdn_cache.put(cache_key, message.attachments[0].url)
+            return message.attachments[0].url, cache_key
+        return None
+
+    async def _send_cached_image(self, interaction: discord.Interaction, embed: discord.Embed, cdn_url: str,
+                                 cache_key: str, file_path, filename: str, content_hash: str,
+                                 data: Optional[bytes] = None) -> Optional[Tuple[str, str]]:
+        """Point the embed at an earlier upload, re-uploading if Discord rejects the URL"""
+        try:
+            if is_video(urlparse(cdn_url).path):
+                await interaction.followup.send(content=cdn_url, embed=embed)
+            else:
+                embed.set_image(url=cdn_url)
+                await interaction.followup.send(embed=embed)
+            return cdn_url, cache_key
+        except discord.NotFound:
+            raise
+        except discord.HTTPException as e:
+            logger.warning(f"Cached CDN URL rejected ({e.code}), uploading {filename} again")
+            self.cdn_cache.invalidate(cache_key)
+            return await self._upload_image(interaction, embed, file_path, filename, content_hash, data)
+
+    async def _load_gallery_item(self, interaction: discord.Interaction, file_path: Path, filename: str,
+                                 use_cdn: bool = True) -> Optional[GalleryItem]:
+        """Get one gallery image ready to send, or None if it can't be made small enough"""
+        content_hash = await self.image_handler.content_hash(file_path)
+        cdn_url, cache_key = None, None
+        if use_cdn:
+            cdn_url, cache_key = self._cached_upload(file_path, content_hash, upload_limit(interaction))
+        # Videos can't be shown in an embed, so those are always attached
+        if cdn_url and not is_video(urlparse(cdn_url).path):
+            return GalleryItem(filename, file_path, content_hash, cache_key, cdn_url, b'')
+
+        data = await self.image_handler.read_file(file_path, content_hash)
+        try:
+            filename, data, cache_key = await self._prepare_upload(
+                interaction, file_path, filename, content_hash, data)
+        except MediaTooLarge as e:
+            logger.warning(f"Leaving out of gallery: {e}")
+            return None
+        return GalleryItem(attachment_filename(filename), file_path, content_hash, cache_key, None, data)
+
+    async def _send_gallery_batch(self, interaction: discord.Interaction, batch: List[GalleryItem],
+                                  header: Optional[discord.Embed]) -> None:
+        """Send one message of a gallery and remember the CDN URLs of its uploads"""
+        files: List[discord.File] = []
+        embeds: List[discord.Embed] = []
+        uploads: List[GalleryItem] = []
+        names = set()
+        for item in batch:
+            if item.cdn_url:
+                embeds.append(discord.Embed().set_image(url=item.cdn_url))
+                continue
+            # Attachment names must be unique within a message
+            name = item.filename if item.filename not in names else f"{len(names)}_{item.filename}"
+            names.add(name)
+            files.append(discord.File(io.BytesIO(item.data), filename=name))
+            uploads.append(item)
+            if not is_video(name):
+                embeds.append(discord.Embed().set_image(url=f"attachment://{name}"))
+
+        if header is not None:
+            if embeds:
+                embeds[0].title, embeds[0].description = header.title, header.description
+                if header.footer.text:
+                    embeds[0].set_footer(text=header.footer.text)
+            else:
+                embeds.append(header)
+
+        kwargs = {'embeds': embeds, 'wait': True}
+        if files:
+            kwargs['files'] = files
+        async with self.upload_scheduler.slot(interaction.channel_id, sum(len(item.data) for item in uploads)):
+            message = await interaction.followup.send(**kwargs)
+        for item, attachment in zip(uploads, message.attachments):
+            self.cdn_cache.put(item.cache_key, attachment.url)
+
+    async def _send_gallery(self, interaction: discord.Interaction, items: List[GalleryItem],
+                            header: Optional[discord.Embed], retry_stale: bool = True) -> None:
+        for batch in pack_gallery(items, upload_limit(interaction)):
+            try:
+                await self._send_gallery_batch(interaction, batch, header)
+            except discord.NotFound:
+                raise
+            except discord.HTTPException as e:
+                stale = [item for item in batch if item.cdn_url]
+                if e.code == 20009 or not stale or not retry_stale:
+                    raise
+                logger.warning(f"Cached CDN URLs rejected ({e.code}), uploading {len(stale)} gallery images again")
+                for item in stale:
+                    self.cdn_cache.invalidate(item.cache_key)
+                reloaded = await asyncio.gather(*(
+                    self._load_gallery_item(interaction, item.file_path, item.filename, use_cdn=False)
+                    for item in stale
+                ))
+                fresh = [item for item in batch if not item.cdn_url] + [item for item in reloaded if item]
+                await self._send_gallery(interaction, fresh, header, retry_stale=False)
+            header = None
+
+    def display_title(self, character: CharacterInfo) -> str:
+        return f"{character.title} GIF" if self.gif_variant else character.title
+
+    def display_description(self, character: CharacterInfo) -> str:
+        return f"Animated GIF - {character.description}" if self.gif_variant else character.description
+
+    async def _pick_image(self, folder: str, limit: int) -> Optional[SharedPick]:
+        """Pick an image and get its bytes ready unless it is already on the CDN"""
+        prefetched = self.prefetcher.take(folder)
+        if prefetched:
+            filename, file_path, content_hash, data = prefetched
+        else:
+            filename, file_path = await self.image_handler.get_random_image_async(folder)
+            content_hash, data = None, None
+
+        if not filename or not file_path:
+            return None
+
+        # Get the next image for this character ready while this one uploads
+        self.prefetcher.schedule(folder)
+
+        if content_hash is None:
+            content_hash = await self.image_handler.content_hash(file_path)
+        if data is None and self._cached_upload(file_path, content_hash, limit)[0] is None:
+            data = await self.image_handler.read_file(file_path, content_hash)
+        return SharedPick(filename, file_path, content_hash, data)
 
     async def send_character_image(self, interaction: discord.Interaction, character: CharacterInfo,
                                    already_deferred: bool = False):
         """Send an embed with random character image"""
+        if not self.image_handler.ready:
+            await self.send_warming_up(interaction)
+            return
+        if self.upload_scheduler.saturated:
+            # Turn the request away before deferring rather than leave it queued
+            await self.send_busy(interaction)
+            return
+
+        title = self.display_title(character)
         try:
             # Only defer if not already deferred
             if not already_deferred:
                 await interaction.response.defer()
 
-            filename, file_path = self.image_handler.get_random_image(character.folder)
+            # Identical requests in the same channel share one pick, one read and one upload
+            with stage('pick'):
+                pick, shared = await self.coalescer.run(
+                    (interaction.channel_id, character.folder),
+                    lambda: self._pick_image(character.folder, upload_limit(interaction))
+                )
 
-            if not filename or not file_path:
+            if pick is None:
                 await interaction.followup.send(
-                    f"No images found for {character.title}",
+                    f"No images found for {title}",
                     ephemeral=True
                 )
                 return
 
             embed = discord.Embed(
-                title=f"{character.title} ({character.source})",
-                description=character.description
-            )
-
-            file = discord.File(
-                file_path,
-                filename=filename
+                title=f"{title} ({character.source})",
+                description=self.display_description(character)
             )
 
+            sent = None
             try:
-                # Try to send the image
-                await interaction.followup.send(file=file, embed=embed)
+                with stage('upload'):
+                    cdn_url, cache_key = self._cached_upload(
+                        pick.file_path, pick.content_hash, upload_limit(interaction))
+                    if cdn_url is None and shared:
+                        # Point at the first request's attachment rather than uploading the same file again
+                        cdn_url, cache_key = await pick.wait_uploaded(SHARED_UPLOAD_WAIT) or (None, None)
+                    if cdn_url:
+                        sent = await self._send_cached_image(interaction, embed, cdn_url, cache_key, pick.file_path,
+                                                             pick.filename, pick.content_hash, pick.data)
+                    else:
+                        sent = await self._upload_image(interaction, embed, pick.file_path, pick.filename,
+                                                        pick.content_hash, pick.data)
             except discord.HTTPException as e:
                 if e.code == 20009:  # Content filtering error
                     # Try sending without the image
                     await interaction.followup.send(
-                        f"Unable to send image for {character.title} due to content restrictions.\n"
-                        f"Description: {character.description}",
+                        f"Unable to send image for {title} due to content restrictions.\n"
+                        f"Description: {self.display_description(character)}",
                         ephemeral=True
                     )
                 else:
                     # For other HTTP errors, raise to be caught by outer try block
                     raise
+            finally:
+                # Release coalesced requests waiting on this upload, successful or not
+                pick.publish(sent)
 
         except discord.NotFound:
             # Interaction already timed out or was handled
             logger.error(f"Interaction not found when sending image for {character.name}")
             return
 
+        except MediaTooLarge as e:
+            logger.warning(str(e))
+            try:
+                await interaction.followup.send(
+                    f"The image picked for {title} is too large to upload here, please try again.",
+                    ephemeral=True
+                )
+            except discord.NotFound:
+                logger.error("Could not send size error - interaction expired")
+
+        except (IOPoolSaturated, UploadQueueFull):
+            await self.send_busy(interaction)
+
         except Exception as e:
             logger.error(f"Error sending image for {character.name}: {e}", exc_info=True)
             try:
                 await interaction.followup.send(
-                    f"Error retrieving image for {character.title}",
+                    f"Error retrieving image for {title}",
                     ephemeral=True
                 )
             except discord.NotFound:
                 # If we can't send the error message, just log it
                 logger.error("Could not send error message - interaction expired")
 
+    async def send_character_gallery(self, interaction: discord.Interaction, character: CharacterInfo,
+                                     count: int, already_deferred: bool = False):
+        """Send count distinct character images in as few messages as possible"""
+        if count <= 1:
+            await self.send_character_image(interaction, character, already_deferred)
+            return
+        if not self.image_handler.ready:
+            await self.send_warming_up(interaction)
+            return
+        if self.upload_scheduler.saturated:
+            await self.send_busy(interaction)
+            return
+
+        title = self.display_title(character)
+        try:
+            if not already_deferred:
+                await interaction.response.defer()
+
+            with stage('pick'):
+                picks = await self.image_handler.get_random_images_async(
+                    character.folder, min(count, MAX_GALLERY_COUNT))
+                loaded = await asyncio.gather(*(
+                    self._load_gallery_item(interaction, file_path, filename) for filename, file_path in picks
+                ))
+            if not picks:
+                await interaction.followup.send(f"No images found for {title}", ephemeral=True)
+                return
+
+            items = [item for item in loaded if item is not None]
+            if not items:
+                await interaction.followup.send(
+                    f"The images picked for {title} are too large to upload here, please try again.",
+                    ephemeral=True
+                )
+                return
+
+            header = discord.Embed(
+                title=f"{title} ({character.source})",
+                description=self.display_description(character)
+            )
+            if len(items) < count:
+                header.set_footer(text=f"{len(items)} of {count} requested images available")
+            with stage('upload'):
+                await self._send_gallery(interaction, items, header)
+
+        except discord.NotFound:
+            logger.error(f"Interaction not found when sending gallery for {character.name}")
+
+        except discord.HTTPException as e:
+            if e.code != 20009:
+                logger.error(f"Error sending gallery for {character.name}: {e}", exc_info=True)
+            try:
+                await interaction.followup.send(
+                    f"Unable to send images for {title}"
+                    + (" due to content restrictions." if e.code == 20009 else "."),
+                    ephemeral=True
+                )
+            except discord.NotFound:
+                logger.error("Could not send error message - interaction expired")
+
+        except (IOPoolSaturated, UploadQueueFull):
+            await self.send_busy(interaction)
+
+        except Exception as e:
+            logger.error(f"Error sending gallery for {character.name}: {e}", exc_info=True)
+            try:
+                await interaction.followup.send(f"Error retrieving images for {title}", ephemeral=True)
+            except discord.NotFound:
+                logger.error("Could not send error message - interaction expired")
+
     def register_character_commands(self):
         """Register commands for all characters"""
         for char_info in self.characters.values():
@@ -92,14 +731,18 @@ class BaseAnimeCog(commands.Cog):
                 else:
                     # Fallback for text commands
                     embed = discord.Embed(
-                        title=f"{char_info.title} ({char_info.source})",
-                        description=char_info.description
+                        title=f"{self.display_title(char_info)} ({char_info.source})",
+                        description=self.display_description(char_info)
                     )
                     try:
-                        filename, file_path = self.image_handler.get_random_image(char_info.folder)
-                        file = discord.File(file_path, filename=filename)
-                        await ctx.send(file=file, embed=embed)
+                        filename, file_path = await self.image_handler.get_random_image_async(char_info.folder)
+                        data = await self.image_handler.read_file(file_path)
+                        file = discord.File(io.BytesIO(data), filename=filename)
+                        async with self.upload_scheduler.slot(ctx.channel.id, len(data)):
+                            await ctx.send(file=file, embed=embed)
+                    except (IOPoolSaturated, UploadQueueFull):
+                        await ctx.send(BUSY_MESSAGE)
                     except Exception as e:
-                        await ctx.send(f"Error retrieving image for {char_info.title}")
+                        await ctx.send(f"Error retrieving image for {self.display_title(char_info)}")
 
             self.__cog_commands__ = self.__cog_commands__ + (character_command,)
\ No newline at end of file
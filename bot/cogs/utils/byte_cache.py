@@ -0,0 +1,81 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger('ByteCache')
+
+
+class ByteCache:
+    """LRU cache of file contents bounded by a total byte budget
+
+    Files larger than ``max_item_bytes`` are never cached so a single big
+    upload can't flush every hot image out of memory.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_item_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes if max_item_bytes is not None else max_bytes // 8
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_served = 0  # Bytes returned from memory
+        self.bytes_loaded = 0  # Bytes that had to come from disk
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_served += len(data)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self.bytes_loaded += len(data)
+        if len(data) > self.max_item_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = data
+            self.current_bytes += len(data)
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            data = self._entries.pop(key, None)
+            if data is not None:
+                self.current_bytes -= len(data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            'entries': len(self._entries),
+            'current_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hit_rate, 4),
+            'evictions': self.evictions,
+            'bytes_served': self.bytes_served,
+            'bytes_loaded': self.bytes_loaded,
+        }
@@ -0,0 +1,84 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger('CdnUrlCache')
+
+
+def signed_url_expiry(url: str) -> Optional[float]:
+    """Read the expiry timestamp from a signed Discord CDN URL (the hex ``ex`` parameter)"""
+    try:
+        expiry = parse_qs(urlparse(url).query).get('ex')
+        return float(int(expiry[0], 16)) if expiry else None
+    except (ValueError, IndexError):
+        return None
+
+
+class CdnUrlCache:
+    """LRU cache from uploaded content to the CDN URL of an earlier upload
+
+    Entries are keyed by what was actually uploaded: a file's content hash
+    for the original, or the key of a variant made from it, so a smaller
+    copy is never mistaken for the original. Discord attachment URLs are signed and expire, so every entry carries
+    an expiry time. Entries that are about to expire are treated as misses
+    and the caller falls back to uploading the file again.
+    """
+
+    def __init__(self, max_entries: int = 10000, expiry_margin: float = 600, default_ttl: float = 86400):
+        self.max_entries = max_entries
+        self.expiry_margin = expiry_margin
+        self.default_ttl = default_ttl
+        self._entries: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a still-valid CDN URL for some content, or None"""
+        return self.get_any((key,))[0]
+
+    def get_any(self, keys: Iterable[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Get the first still-valid CDN URL among keys, as (url, key), counting one hit or miss"""
+        for key in keys:
+            url = self._lookup(key)
+            if url is not None:
+                self.hits += 1
+                return url, key
+        self.misses += 1
+        return None, None
+
+    def _lookup(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        url, expires_at = entry
+        if expires_at - self.expiry_margin <= time.time():
+            del self._entries[key]
+            self.expired += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return url
+
+    def put(self, key: str, url: str) -> None:
+        """Remember the CDN URL returned for an upload"""
+        expires_at = signed_url_expiry(url) or time.time() + self.default_ttl
+        self._entries[key] = (url, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Forget a URL that turned out to be unusable"""
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+        }
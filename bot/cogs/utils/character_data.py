@@ -0,0 +1,105 @@
+import json
+import logging
+import marshal
+import mmap
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger('CharacterData')
+
+# Source of truth, one character per line: {series: {char_id: {title, description, aliases}}}
+DEFAULT_DATA_PATH = Path(__file__).resolve().parents[2] / 'data' / 'characters.json'
+DEFAULT_CACHE_PATH = './data/characters.marshal'
+
+# Bump when the compiled layout changes; marshal output is also tied to the Python version
+CACHE_FORMAT = 1
+
+Descriptions = Dict[str, Dict[str, Tuple[str, str]]]
+Mappings = Dict[str, Dict[str, List[str]]]
+
+
+def _cache_key(stat: os.stat_result) -> tuple:
+    return CACHE_FORMAT, sys.version_info[:2], stat.st_size, stat.st_mtime_ns
+
+
+def _split(data: dict) -> Tuple[Descriptions, Mappings]:
+    """Split the per-character records into the description and alias tables"""
+    descriptions: Descriptions = {}
+    mappings: Mappings = {}
+    for series, characters in data.items():
+        series = sys.intern(series)
+        descriptions[series] = {}
+        mappings[series] = {}
+        for char_id, record in characters.items():
+            char_id = sys.intern(char_id)
+            if 'title' in record:
+                descriptions[series][char_id] = (record['title'], record.get('description', ''))
+            if 'aliases' in record:
+                mappings[series][char_id] = [sys.intern(alias) for alias in record['aliases']]
+    return descriptions, mappings
+
+
+def _read_cache(cache_path: Path, key: tuple) -> Optional[Tuple[Descriptions, Mappings]]:
+    try:
+        with open(cache_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            cached_key, descriptions, mappings = marshal.loads(mapped)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if cached_key != key:
+        return None
+    return descriptions, mappings
+
+
+def _write_cache(cache_path: Path, key: tuple, descriptions: Descriptions, mappings: Mappings) -> None:
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file per writer: cluster processes starting together may all rebuild the cache
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=f".{cache_path.name}.",
+                                         suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            marshal.dump((key, descriptions, mappings), f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write character data cache {cache_path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def data_file_path() -> Path:
+    """Get the character data source in use, honouring CHARACTER_DATA"""
+    return Path(os.getenv('CHARACTER_DATA') or DEFAULT_DATA_PATH)
+
+
+def load_character_data(data_path: Optional[str] = None,
+                        cache_path: Optional[str] = None) -> Tuple[Descriptions, Mappings]:
+    """Load (CHARACTER_DESCRIPTIONS, CHARACTER_MAPPINGS) from the character data file
+
+    The JSON source is compiled once into a marshal cache that later
+    loads (and other processes) read straight from a memory map. The
+    cache is rebuilt whenever the source file changes.
+    """
+    data_path = Path(data_path) if data_path else data_file_path()
+    cache_path = Path(cache_path or os.getenv('CHARACTER_DATA_CACHE') or DEFAULT_CACHE_PATH)
+
+    key = _cache_key(os.stat(data_path))
+    cached = _read_cache(cache_path, key)
+    if cached is not None:
+        logger.debug(f"Loaded character data from cache {cache_path}")
+        return cached
+
+    with open(data_path, encoding='utf-8') as f:
+        descriptions, mappings = _split(json.load(f))
+    _write_cache(cache_path, key, descriptions, mappings)
+    logger.info(
+        f"Compiled character data {data_path}: "
+        f"{sum(len(chars) for chars in descriptions.values())} described characters "
+        f"across {len(descriptions)} series"
+    )
+    return descriptions, mappings
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+logger = logging.getLogger('RequestCoalescer')
+
+T = TypeVar('T')
+
+
+class RequestCoalescer:
+    """Shares one piece of work between identical requests made close together
+
+    The first request for a key starts the work; any request for the same
+    key within ``window`` seconds of that gets the same result instead of
+    starting its own. A window of 0 turns coalescing off.
+    """
+
+    def __init__(self, window: float = 1.0):
+        self.window = window
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Get the result of work for key, and whether it was shared with an earlier request"""
+        if self.window <= 0:
+            return await work(), False
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"Coalesced request for {key}")
+            # Shielded so one requester giving up doesn't cancel the others
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(work())
+        self._inflight[key] = task
+        self.started += 1
+        asyncio.get_running_loop().call_later(self.window, self._expire, key, task)
+        return await asyncio.shield(task), False
+
+    def _expire(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.done() and not task.cancelled():
+            # Mark any error as seen; whoever awaited it already handled it
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {'started': self.started, 'coalesced': self.coalesced, 'inflight': len(self._inflight)}
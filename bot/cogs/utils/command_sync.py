@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import discord
+from discord import app_commands
+
+logger = logging.getLogger('CommandSync')
+
+
+def tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """Hash the payload a sync would upload for one scope
+
+    Commands are serialized exactly as discord.py sends them and sorted,
+    so the hash only changes when Discord would see a different tree.
+    """
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get('type', 1), command['name'])
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+class CommandSyncState:
+    """Last synced tree hash per scope, kept on disk so restarts can skip unchanged syncs"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._scopes: Dict[str, Dict[str, float]] = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._scopes = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable command sync state {self.path}: {e}")
+
+    @staticmethod
+    def scope_key(application_id: Optional[int], guild: Optional[discord.abc.Snowflake] = None) -> str:
+        scope = f"guild:{guild.id}" if guild is not None else "global"
+        return f"{application_id}:{scope}"
+
+    def is_current(self, scope: str, digest: str) -> bool:
+        return self._scopes.get(scope, {}).get('hash') == digest
+
+    def last_duration(self, scope: str) -> float:
+        """Seconds the last real sync of a scope took"""
+        return self._scopes.get(scope, {}).get('duration', 0.0)
+
+    def record(self, scope: str, digest: str, duration: float) -> None:
+        self._scopes[scope] = {'hash': digest, 'duration': duration, 'synced_at': time.time()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._scopes, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save command sync state {self.path}: {e}")
+
+
+async def sync_if_changed(
+        tree: app_commands.CommandTree,
+        state: CommandSyncState,
+        guild: Optional[discord.abc.Snowflake] = None,
+        force: bool = False
+) -> Optional[List[app_commands.AppCommand]]:
+    """Sync a scope unless its tree hash matches the last successful sync
+
+    Returns the synced commands, or None when the sync was skipped.
+    """
+    scope = state.scope_key(tree.client.application_id, guild)
+    digest = tree_hash(tree, guild)
+    if not force and state.is_current(scope, digest):
+        logger.info(
+            f"Command tree for {scope} unchanged, skipped sync "
+            f"(saved ~{state.last_duration(scope):.2f}s)"
+        )
+        return None
+
+    started = time.perf_counter()
+    synced = await tree.sync(guild=guild)
+    duration = time.perf_counter() - started
+    state.record(scope, digest, duration)
+    logger.info(f"Synced {len(synced)} commands for {scope} in {duration:.2f}s")
+    return synced
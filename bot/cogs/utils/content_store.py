@@ -0,0 +1,189 @@
+import errno
+import logging
+import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from .handlers import hash_file
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows; entries are always hardlinked there
+    fcntl = None
+
+logger = logging.getLogger('ContentStore')
+
+# Linux ioctl that makes one file a copy-on-write clone of another (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+# Errors meaning the filesystem can't clone, as opposed to the file being a problem
+NO_REFLINK_ERRORS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash);
+"""
+
+
+def clone_file(src: Path, dst: Path) -> None:
+    """Write dst as a copy-on-write clone of src, sharing its disk blocks"""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform")
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'xb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        shutil.copymode(src, dst)
+    except OSError:
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class ContentStore:
+    """Content-addressed blob store backing a media tree
+
+    Every distinct file is kept once under ``objects/<aa>/<hash><ext>``.
+    Folder entries share their blob's storage, so existing paths keep
+    working while identical bytes only take disk space once. A manifest
+    maps each entry to its hash, which lets the bot know the content
+    hash of a file without reading it.
+
+    Entries are reflinks (copy-on-write clones) where the filesystem
+    supports them, so editing one leaves the others alone. Elsewhere they
+    are hardlinks: editing a file in place then changes every entry with
+    the same content, and the blob along with them. Replace files rather
+    than editing them on such trees. Such an edit is caught by the size
+    and mtime recorded for each entry; the next ingest drops the blob and
+    rehashes the entries that shared it.
+    """
+
+    def __init__(self, cas_dir: str, reflinks: bool = True):
+        self.cas_dir = Path(cas_dir)
+        self.objects_dir = self.cas_dir / 'objects'
+        self.manifest_path = self.cas_dir / 'manifest.sqlite3'
+        self.reflinks = reflinks
+
+    @property
+    def link_mode(self) -> str:
+        return 'reflink' if self.reflinks else 'hardlink'
+
+    @property
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    @contextmanager
+    def manifest(self) -> Iterator[sqlite3.Connection]:
+        """Open the manifest, committing on success"""
+        self.cas_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.manifest_path)
+        try:
+            conn.executescript(SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def blob_path(self, content_hash: str, suffix: str) -> Path:
+        return self.objects_dir / content_hash[:2] / f"{content_hash}{suffix.lower()}"
+
+    def _share(self, src: Path, dst: Path) -> None:
+        """Create dst with src's contents without storing them twice"""
+        if self.reflinks:
+            try:
+                clone_file(src, dst)
+                return
+            except OSError as e:
+                if e.errno not in NO_REFLINK_ERRORS:
+                    raise
+                self.reflinks = False
+                logger.warning(
+                    f"{self.objects_dir} does not support reflinks, falling back to hardlinks: "
+                    f"editing a file in place will change every entry with the same content"
+                )
+        os.link(src, dst)
+
+    def ingest(self, file_path: Path, conn: sqlite3.Connection) -> Tuple[str, int]:
+        """Make a folder entry share storage with its blob
+
+        Returns the content hash and the number of bytes freed, which is
+        the file size when an identical blob already existed. Entries
+        unchanged since they were last ingested are skipped.
+        """
+        file_path = Path(file_path)
+        entry_key = str(file_path.resolve())
+        stat = os.stat(file_path)
+        known = conn.execute(
+            "SELECT hash, size, mtime_ns FROM entries WHERE path = ?", (entry_key,)
+        ).fetchone()
+        if known is not None and (known[1], known[2]) == (stat.st_size, stat.st_mtime_ns):
+            return known[0], 0
+
+        content_hash = hash_file(file_path)
+        if known is not None and known[0] != content_hash:
+            self._drop_edited_blob(file_path, known[0])
+
+        blob = self.blob_path(content_hash, file_path.suffix)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+
+        saved = 0
+        if not blob.exists():
+            # First copy of this content: the blob is made from the entry itself
+            self._share(file_path, blob)
+        elif not os.path.samefile(blob, file_path):
+            saved = stat.st_size
+            tmp_path = file_path.with_name(f".{file_path.name}.cas-tmp")
+            self._share(blob, tmp_path)
+            os.replace(tmp_path, file_path)
+
+        stat = os.stat(file_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (path, hash, size, mtime_ns) VALUES (?, ?, ?, ?)",
+            (entry_key, content_hash, stat.st_size, stat.st_mtime_ns)
+        )
+        return content_hash, saved
+
+    def _drop_edited_blob(self, file_path: Path, old_hash: str) -> None:
+        """Remove a blob whose bytes were changed through a hardlinked entry
+
+        Its name no longer matches its contents. The other entries that
+        shared it still have their data, and are rehashed when next
+        ingested because their mtime no longer matches the manifest.
+        """
+        old_blob = self.blob_path(old_hash, file_path.suffix)
+        try:
+            if not os.path.samefile(old_blob, file_path):
+                return
+        except FileNotFoundError:
+            return
+        os.unlink(old_blob)
+        logger.warning(
+            f"{file_path} was edited in place, which changed its hardlinked blob {old_hash[:12]}; "
+            f"entries that shared it will be rehashed"
+        )
+
+    def load_hashes(self, root_dir: Path) -> Dict[Path, Tuple[int, int, str]]:
+        """Get (size, mtime_ns, hash) for every manifest entry under a root, keyed by index path"""
+        root_dir = Path(root_dir)
+        prefix = os.path.join(str(root_dir.resolve()), '')
+        with self.manifest() as conn:
+            rows = conn.execute(
+                "SELECT path, hash, size, mtime_ns FROM entries WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix)
+            ).fetchall()
+        return {root_dir / path[len(prefix):]: (size, mtime_ns, content_hash)
+                for path, content_hash, size, mtime_ns in rows}
+
+    def stats(self) -> Dict[str, int]:
+        with self.manifest() as conn:
+            entries, blobs = conn.execute("SELECT COUNT(*), COUNT(DISTINCT hash) FROM entries").fetchone()
+        return {'entries': entries, 'blobs': blobs}
@@ -0,0 +1,91 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger('DiskCache')
+
+
+class DiskCache:
+    """Directory of derived files kept under a total byte budget
+
+    Files are evicted least-recently-used first. Usage order survives a
+    restart through file mtimes, which are bumped whenever an entry is
+    served.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, int]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.evictions = 0
+        self._load()
+
+    def _load(self) -> None:
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+            self.current_bytes += size
+        logger.info(f"Disk cache {self.cache_dir}: {len(self._entries)} files, {self.current_bytes} bytes")
+        self._evict()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def path_for(self, name: str) -> Path:
+        return self.cache_dir / name
+
+    def get(self, name: str) -> Optional[Path]:
+        """Get the path of a cached file and mark it as recently used"""
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        path = self.path_for(name)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.current_bytes -= self._entries.pop(name, 0)
+            return None
+        return path
+
+    def add(self, name: str) -> None:
+        """Register a file that was just written into the cache directory"""
+        size = os.path.getsize(self.path_for(name))
+        with self._lock:
+            self.current_bytes -= self._entries.pop(name, 0)
+            self._entries[name] = size
+            self.current_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while True:
+            with self._lock:
+                if self.current_bytes <= self.max_bytes or not self._entries:
+                    return
+                name, size = self._entries.popitem(last=False)
+                self.current_bytes -= size
+                self.evictions += 1
+            try:
+                os.remove(self.path_for(name))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'files': len(self._entries),
+            'current_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions,
+        }
@@ -1,60 +1,192 @@
+import asyncio
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
-import random
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict
+import hashlib
 import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+from .byte_cache import ByteCache
+from .io_pool import BlockingIOPool
+from .media_catalog import MediaCatalog
+from .media_index import MediaIndex
+from .media_watcher import MediaWatcher
+
+if TYPE_CHECKING:
+    from .content_store import ContentStore
+
 logger = logging.getLogger('AnimeHandlers')
 
+# Content hashes remembered per handler; least recently used paths are forgotten first
+MAX_HASH_ENTRIES = 100_000
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CharacterInfo:
-    """Character information class"""
+    """Character information class
+
+    Records are slotted, immutable and built from interned strings, so a
+    single instance is shared read-only by every cog.
+    """
     name: str  # Character's internal name/ID
     title: str  # Display name
     description: str  # Character description
     folder: str  # Image folder path
     source: str  # Series name
-    aliases: List[str]  # Alternative names/spellings
+    aliases: Tuple[str, ...]  # Alternative names/spellings
+
+
+def hash_file(file_path: Path) -> str:
+    """Hash a file's contents in 1 MiB chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash bytes already in memory, matching hash_file"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 class ImageHandler:
     """Handle image file operations"""
 
-    def __init__(self, root_dir: str):
+    def __init__(self, root_dir: str, catalog: Optional[MediaCatalog] = None,
+                 io_pool: Optional[BlockingIOPool] = None, byte_cache: Optional[ByteCache] = None,
+                 content_store: Optional['ContentStore'] = None, max_hashes: int = MAX_HASH_ENTRIES):
         self.root_dir = Path(root_dir)
         if not self.root_dir.exists():
             logger.error(f"Root directory does not exist: {root_dir}")
             raise FileNotFoundError(f"Directory not found: {root_dir}")
+        self.io_pool = io_pool or BlockingIOPool()
+        self.byte_cache = byte_cache
+        self._hashes: 'OrderedDict[Path, Tuple[int, int, str]]' = OrderedDict()
+        self._hashes_lock = threading.Lock()
+        self.max_hashes = max_hashes
+        self._content_store = content_store
+        self.index = MediaIndex(self.root_dir, catalog=catalog)
+        self.watcher: Optional[MediaWatcher] = None
+        self.ready = False
+
+    def build_index(self) -> None:
+        """Load known content hashes and build the media index (blocking)"""
+        if self._content_store is not None and self._content_store.exists:
+            # Entries in a content-addressed tree already know their blob hash
+            hashes = self._content_store.load_hashes(self.root_dir)
+            with self._hashes_lock:
+                self._hashes.update(hashes)
+                self._trim_hashes()
+            logger.info(f"Resolved {len(hashes)} files under {self.root_dir} to content blobs")
+        self.index.build()
+        self.ready = True
+
+    async def warm_up(self) -> None:
+        """Build the media index off the event loop"""
+        await asyncio.to_thread(self.build_index)
+
+    def start_watching(self, poll_interval: float = 5.0, use_inotify: bool = True) -> None:
+        """Keep the media index in sync with the filesystem in the background"""
+        if self.watcher is None:
+            self.watcher = MediaWatcher(self.index, poll_interval=poll_interval, use_inotify=use_inotify)
+            self.watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background filesystem watcher"""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def refresh(self, subfolder: Optional[str] = None) -> None:
+        """Rescan one folder (or the whole root) and update the media index"""
+        self.index.refresh(subfolder)
 
     def get_random_image(self, subfolder: str) -> Tuple[str, Path]:
         """Get a random image from specified subfolder"""
-        dir_path = self.root_dir / subfolder
-
-        if not dir_path.exists():
-            logger.error(f"Subfolder does not exist: {dir_path}")
-            raise FileNotFoundError(f"Directory not found: {dir_path}")
-
-        try:
-            valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-            files = [
-                p for p in dir_path.iterdir()
-                if (p.is_file() and
-                    p.suffix.lower() in valid_extensions and
-                    not p.name.startswith('.'))  # Filter out hidden files
-            ]
+        random_file = self.index.pick(subfolder)
+
+        if random_file is None:
+            logger.error(f"No valid image files indexed for {self.root_dir / subfolder}")
+            raise ValueError(f"No image files found in {self.root_dir / subfolder}")
+
+        logger.debug(f"Selected random file: {random_file}")
+        return random_file.name, random_file
+
+    async def get_random_image_async(self, subfolder: str) -> Tuple[str, Path]:
+        """Get a random image, falling back to a pooled folder rescan if nothing is indexed"""
+        if not self.index.has_folder(subfolder):
+            await self.io_pool.run(self.index.refresh, subfolder)
+        return self.get_random_image(subfolder)
+
+    async def get_random_images_async(self, subfolder: str, count: int) -> List[Tuple[str, Path]]:
+        """Get up to count distinct random images from a folder"""
+        if not self.index.has_folder(subfolder):
+            await self.io_pool.run(self.index.refresh, subfolder)
+        return [(path.name, path) for path in self.index.sample(subfolder, count)]
+
+    async def read_file(self, file_path: Path, content_hash: Optional[str] = None) -> bytes:
+        """Read a media file, from the byte cache if possible, otherwise on the I/O pool"""
+        if self.byte_cache is None:
+            return await self.io_pool.run(Path(file_path).read_bytes)
+
+        # Keying on content means an edited file can never be served stale.
+        # Hashing a file the cache can hold reads it whole and caches it, so this is one read.
+        key = content_hash or await self.content_hash(file_path)
+        data = self.byte_cache.get(key)
+        if data is None:
+            data = await self.io_pool.run(Path(file_path).read_bytes)
+            self.byte_cache.put(key, data)
+        return data
+
+    def known_size(self, file_path: Path) -> Optional[int]:
+        """Size of a file when it was last hashed, without touching the disk"""
+        with self._hashes_lock:
+            cached = self._hashes.get(Path(file_path))
+        return cached[0] if cached else None
+
+    def _trim_hashes(self) -> None:
+        while len(self._hashes) > self.max_hashes:
+            self._hashes.popitem(last=False)
+
+    def _hash_file(self, file_path: Path) -> Tuple[str, Optional[bytes]]:
+        """Hash a file's contents, reusing the last digest while size and mtime are unchanged
+
+        Files small enough for the byte cache are read whole and hashed in
+        memory; their bytes are returned so the caller doesn't read them again.
+        """
+        stat = os.stat(file_path)
+        with self._hashes_lock:
+            cached = self._hashes.get(file_path)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                self._hashes.move_to_end(file_path)
+                return cached[2], None
+
+        data = None
+        if self.byte_cache is not None and stat.st_size <= self.byte_cache.max_item_bytes:
+            data = Path(file_path).read_bytes()
+            content_hash = hash_bytes(data)
+        else:
+            content_hash = hash_file(file_path)
 
-            if not files:
-                logger.error(f"No valid image files found in {dir_path}")
-                raise ValueError(f"No image files found in {dir_path}")
+        with self._hashes_lock:
+            self._hashes[file_path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+            self._trim_hashes()
+        return content_hash, data
 
-            random_file = random.choice(files)
-            logger.debug(f"Selected random file: {random_file}")
-            return random_file.name, random_file
+    async def content_hash(self, file_path: Path) -> str:
+        """Get a stable hash of a file's contents"""
+        content_hash, data = await self.io_pool.run(self._hash_file, Path(file_path))
+        if data is not None:
+            self.byte_cache.put(content_hash, data)
+        return content_hash
 
-        except Exception as e:
-            logger.error(f"Error accessing {dir_path}: {str(e)}", exc_info=True)
-            raise
+    async def refresh_async(self, subfolder: Optional[str] = None) -> None:
+        """Rescan media on the I/O pool"""
+        await self.io_pool.run(self.index.refresh, subfolder)
 
 def normalize_character_id(char_id: str) -> str:
     """Normalize character ID to handle edge cases"""
@@ -120,13 +252,14 @@ def create_character_info(
         folder = f"{source}/{normalized_id}"
 
         # Create character info object
+        # Interned so equal ids, aliases and series names share one string object
         char_info = CharacterInfo(
-            name=normalized_id,
-            title=display_name,
+            name=sys.intern(normalized_id),
+            title=sys.intern(display_name),
             description=description,
-            folder=folder,
-            source=source.replace('_', ' ').title(),
-            aliases=list(set(aliases))  # Remove duplicates
+            folder=sys.intern(folder),
+            source=sys.intern(source.replace('_', ' ').title()),
+            aliases=tuple(sys.intern(alias) for alias in dict.fromkeys(aliases))  # Remove duplicates, keeping order
         )
 
         logger.debug(f"Successfully created CharacterInfo for {char_id} in {source}")
@@ -0,0 +1,55 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger('BlockingIOPool')
+
+T = TypeVar('T')
+
+
+class IOPoolSaturated(Exception):
+    """Raised when too much blocking I/O is already queued"""
+
+
+class BlockingIOPool:
+    """Bounded thread pool for blocking filesystem work
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue`` more
+    wait behind them. Anything beyond that is rejected with IOPoolSaturated,
+    so a slow disk turns into fast errors instead of an ever-growing backlog.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='media-io')
+        self._pending = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free worker"""
+        return max(0, self._pending - self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs running or waiting"""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in the pool and await its result"""
+        if self._pending >= self.max_workers + self.max_queue:
+            logger.warning(f"I/O pool saturated ({self._pending} jobs in flight)")
+            raise IOPoolSaturated("Too many file operations are queued")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop accepting work and let running jobs finish"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,229 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger('JobQueue')
+
+_current_job: contextvars.ContextVar[Optional['Job']] = contextvars.ContextVar('current_job', default=None)
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is too deep to take more work"""
+
+
+class StageStats:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Job:
+    """One unit of queued work with its per-stage timings"""
+
+    __slots__ = ('id', 'name', 'work', 'timeout', 'on_timeout', 'submitted', 'started', 'stages', 'task',
+                 'cancelled', '__weakref__')
+
+    def __init__(self, job_id: int, name: str, work: Callable[[], Awaitable[None]], timeout: Optional[float],
+                 on_timeout: Optional[Callable[[], Awaitable[None]]] = None):
+        self.id = job_id
+        self.name = name
+        self.work = work
+        self.timeout = timeout
+        self.on_timeout = on_timeout
+        self.submitted = time.perf_counter()
+        self.started = 0.0
+        self.stages: List[tuple] = []
+        self.task: Optional[asyncio.Task] = None
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Drop the job if it is still queued, or cancel it if it is running"""
+        self.cancelled = True
+        if self.task is not None:
+            self.task.cancel()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage of the job running in this context; does nothing outside a job"""
+    job = _current_job.get()
+    if job is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        job.stages.append((name, time.perf_counter() - started))
+
+
+class JobQueue:
+    """Bounded queue of interaction jobs served by a fixed pool of worker tasks
+
+    Handlers acknowledge the interaction, then submit the slow part as a
+    job. At most ``max_depth`` jobs may wait; submit raises JobQueueFull
+    beyond that so the handler can answer "busy" straight away. A job's
+    timeout counts from when it was submitted, queue wait included: jobs
+    that expire while queued are dropped, and running ones are cancelled
+    when their time is up. Either way the job's on_timeout hook runs.
+    """
+
+    def __init__(self, workers: int = 8, max_depth: int = 64):
+        self.workers = workers
+        self.max_depth = max_depth
+        self._queue: 'asyncio.Queue[Job]' = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._ids = itertools.count(1)
+        self._busy = 0
+        self.stage_stats: Dict[str, StageStats] = {}
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.cancelled = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize()
+
+    @property
+    def saturated(self) -> bool:
+        return self.depth >= self.max_depth
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job workers (queue depth {self.max_depth})")
+
+    async def close(self) -> None:
+        """Stop the workers, cancelling running jobs and dropping queued ones"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            self._queue.get_nowait().cancel()
+
+    def submit(self, work: Callable[[], Awaitable[None]], name: str = 'job', timeout: Optional[float] = None,
+               on_timeout: Optional[Callable[[], Awaitable[None]]] = None) -> Job:
+        """Queue work for a worker, or raise JobQueueFull"""
+        if self.saturated:
+            self.rejected += 1
+            logger.warning(f"Job queue full ({self.depth} waiting, {self._busy} running), rejecting {name}")
+            raise JobQueueFull("Too many jobs are queued")
+        job = Job(next(self._ids), name, work, timeout, on_timeout)
+        self._queue.put_nowait(job)
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.cancelled:
+                    self.cancelled += 1
+                    continue
+                self._busy += 1
+                try:
+                    await self._run(job)
+                finally:
+                    self._busy -= 1
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.started = time.perf_counter()
+        waited = job.started - job.submitted
+        self._record('queue wait', waited)
+
+        remaining = None
+        if job.timeout is not None:
+            remaining = job.timeout - waited
+            if remaining <= 0:
+                self.timed_out += 1
+                logger.warning(f"Job {job.id} ({job.name}) waited {waited:.1f}s, past its {job.timeout:g}s timeout")
+                await self._timed_out(job)
+                return
+
+        job.task = asyncio.create_task(self._run_in_context(job))
+        try:
+            await asyncio.wait_for(job.task, remaining)
+            self.completed += 1
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logger.warning(f"Job {job.id} ({job.name}) timed out after {job.timeout:g}s")
+            await self._timed_out(job)
+        except asyncio.CancelledError:
+            job.task.cancel()
+            if job.cancelled:
+                self.cancelled += 1
+            else:
+                raise
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Job {job.id} ({job.name}) failed: {e}", exc_info=True)
+        finally:
+            for name, seconds in job.stages:
+                self._record(name, seconds)
+            self._record('total', time.perf_counter() - job.submitted)
+
+    @staticmethod
+    async def _timed_out(job: Job) -> None:
+        if job.on_timeout is None:
+            return
+        try:
+            await job.on_timeout()
+        except Exception as e:
+            logger.error(f"Timeout handler for job {job.id} ({job.name}) failed: {e}")
+
+    @staticmethod
+    async def _run_in_context(job: Job) -> None:
+        # Tasks get a copy of the context, so this only marks stages inside the job's own task
+        _current_job.set(job)
+        await job.work()
+
+    def _record(self, name: str, seconds: float) -> None:
+        stats = self.stage_stats.get(name)
+        if stats is None:
+            stats = self.stage_stats[name] = StageStats()
+        stats.add(seconds)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            'workers': self.workers,
+            'busy': self._busy,
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'cancelled': self.cancelled,
+            'stages': {
+                name: {'count': s.count, 'avg': s.average, 'max': s.max}
+                for name, s in self.stage_stats.items()
+            },
+        }
@@ -0,0 +1,202 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .media_index import is_media_file, media_type_for
+
+logger = logging.getLogger('MediaCatalog')
+
+# Rescanned directories written per transaction, so other writers (other
+# cogs' scans, other cluster processes) get the database between batches
+WRITE_BATCH_DIRS = 200
+
+# How long a writer waits for another process's transaction before giving up
+BUSY_TIMEOUT = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (root, path)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS files (
+    root TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    media_type TEXT NOT NULL,
+    PRIMARY KEY (root, dir, name)
+) WITHOUT ROWID;
+"""
+
+
+class MediaCatalog:
+    """Persistent SQLite catalog of media files for fast warm starts
+
+    Each directory is stored with its mtime. On startup only directories
+    whose mtime changed are listed again; everything else is read straight
+    from the catalog, so a warm start costs one stat per directory.
+
+    Use MediaCatalog.shared() so every cog in a process goes through one
+    instance, whose scans take turns instead of contending for the lock.
+    """
+
+    _shared: Dict[Path, 'MediaCatalog'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @classmethod
+    def shared(cls, db_path: str) -> 'MediaCatalog':
+        """Get this process's catalog for a database, opening it on first use"""
+        key = Path(db_path).resolve()
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None:
+                catalog = cls._shared[key] = cls(db_path)
+            return catalog
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it"""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _list_dir(dir_path: Path) -> Tuple[List[Tuple[str, int, int, str]], List[str]]:
+        """List media files (with size and mtime) and subdirectories of a directory"""
+        files, sub_dirs = [], []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    sub_dirs.append(entry.name)
+                elif is_media_file(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    files.append((entry.name, stat.st_size, stat.st_mtime_ns, media_type_for(entry.name)))
+        return files, sub_dirs
+
+    def scan(self, root_dir: Path) -> Dict[str, List[str]]:
+        """Bring the catalog up to date for a root and return its folder -> file names map"""
+        start = time.perf_counter()
+        root_dir = Path(root_dir)
+        root = str(root_dir.resolve())
+
+        with self._write_lock, self._connect() as conn:
+            known: Dict[str, int] = {}
+            children: Dict[str, List[str]] = defaultdict(list)
+            for path, parent, mtime_ns in conn.execute(
+                    "SELECT path, parent, mtime_ns FROM directories WHERE root = ?", (root,)):
+                known[path] = mtime_ns
+                if parent is not None:
+                    children[parent].append(path)
+
+            seen = set()
+            rescanned = 0
+            stack = ['']
+            while stack:
+                rel = stack.pop()
+                dir_path = root_dir / rel
+                try:
+                    mtime_ns = os.stat(dir_path).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(rel)
+
+                if known.get(rel) == mtime_ns:
+                    stack.extend(children[rel])
+                    continue
+
+                try:
+                    files, sub_dirs = self._list_dir(dir_path)
+                except OSError as e:
+                    logger.error(f"Failed to scan {dir_path}: {e}")
+                    continue
+
+                rescanned += 1
+                parent = None if rel == '' else (rel.rpartition('/')[0])
+                conn.execute("DELETE FROM files WHERE root = ? AND dir = ?", (root, rel))
+                conn.executemany(
+                    "INSERT INTO files (root, dir, name, size, mtime_ns, media_type) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(root, rel, *file_row) for file_row in files]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO directories (root, path, parent, mtime_ns) VALUES (?, ?, ?, ?)",
+                    (root, rel, parent, mtime_ns)
+                )
+                stack.extend(f"{rel}/{name}" if rel else name for name in sub_dirs)
+                if rescanned % WRITE_BATCH_DIRS == 0:
+                    conn.commit()
+
+            stale = [(root, path) for path in known if path not in seen]
+            if stale:
+                conn.executemany("DELETE FROM files WHERE root = ? AND dir = ?", stale)
+                conn.executemany("DELETE FROM directories WHERE root = ? AND path = ?", stale)
+
+            folders: Dict[str, List[str]] = defaultdict(list)
+            for rel, name in conn.execute("SELECT dir, name FROM files WHERE root = ?", (root,)):
+                folders[rel].append(name)
+
+        logger.info(
+            f"Catalog scan of {root_dir}: {len(seen)} directories, {rescanned} rescanned, "
+            f"{len(stale)} removed in {time.perf_counter() - start:.2f}s"
+        )
+        return folders
+
+    def stats(self, root_dir: Path) -> Dict[str, int]:
+        """Summarize cataloged files for a root by media type"""
+        root = str(Path(root_dir).resolve())
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT media_type, COUNT(*), SUM(size) FROM files WHERE root = ? GROUP BY media_type",
+                (root,)
+            ).fetchall()
+        summary = {}
+        for media_type, count, total_size in rows:
+            summary[f"{media_type}_files"] = count
+            summary[f"{media_type}_bytes"] = total_size or 0
+        return summary
+
+    def files_larger_than(self, root_dir: Path, min_size: int) -> List[Tuple[Path, int]]:
+        """List cataloged files under a root that are bigger than min_size bytes"""
+        root_dir = Path(root_dir)
+        root = str(root_dir.resolve())
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT dir, name, size FROM files WHERE root = ? AND size > ? ORDER BY size DESC",
+                (root, min_size)
+            ).fetchall()
+        return [(root_dir / rel / name, size) for rel, name, size in rows]
+
+    def files_with_extension(self, root_dir: Path, extension: str) -> List[Tuple[Path, int]]:
+        """List cataloged files under a root with an extension like '.gif', largest first"""
+        root_dir = Path(root_dir)
+        root = str(root_dir.resolve())
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT dir, name, size FROM files WHERE root = ? AND lower(name) LIKE ? ORDER BY size DESC",
+                (root, f"%{extension.lower()}")
+            ).fetchall()
+        return [(root_dir / rel / name, size) for rel, name, size in rows]
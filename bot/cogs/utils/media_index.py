@@ -0,0 +1,322 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .media_catalog import MediaCatalog
+
+logger = logging.getLogger('MediaIndex')
+
+VALID_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+
+def is_media_file(name: str) -> bool:
+    """Check whether a file name looks like a servable media file"""
+    if name.startswith('.'):  # Filter out hidden files
+        return False
+    return os.path.splitext(name)[1].lower() in VALID_EXTENSIONS
+
+
+def media_type_for(name: str) -> str:
+    """Classify a media file as 'gif' or 'image' by its extension"""
+    return 'gif' if name.lower().endswith('.gif') else 'image'
+
+
+class MediaFolder:
+    """Files in one folder, with O(1) random pick, add and remove"""
+
+    __slots__ = ('files', 'positions')
+
+    def __init__(self, files: Optional[List[Path]] = None):
+        self.files: List[Path] = []
+        self.positions: Dict[str, int] = {}
+        for path in files or ():
+            self.add(path)
+
+    def add(self, path: Path) -> bool:
+        if path.name in self.positions:
+            return False
+        self.positions[path.name] = len(self.files)
+        self.files.append(path)
+        return True
+
+    def remove(self, name: str) -> bool:
+        position = self.positions.pop(name, None)
+        if position is None:
+            return False
+        # Swap the last file into the hole so removal stays O(1)
+        last = self.files.pop()
+        if position < len(self.files):
+            self.files[position] = last
+            self.positions[last.name] = position
+        return True
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+class MediaIndex:
+    """In-memory index mapping each media folder to its valid files"""
+
+    def __init__(self, root_dir: Path, catalog: Optional['MediaCatalog'] = None):
+        self.root_dir = Path(root_dir)
+        self.catalog = catalog
+        self._folders: Dict[str, MediaFolder] = {}
+        self._lock = threading.Lock()
+        # Near-duplicate clusters: file -> cluster id, and (folder, cluster id) -> members in that folder
+        self._clusters: Dict[Path, int] = {}
+        self._cluster_sizes: Dict[Tuple[str, int], int] = {}
+
+    @staticmethod
+    def _key(subfolder: str) -> str:
+        """Normalize a folder key so lookups don't depend on slashes"""
+        key = Path(subfolder).as_posix().strip('/')
+        return '' if key == '.' else key
+
+    def key_for(self, dir_path: Path) -> str:
+        """Get the index key for an absolute or root-relative directory"""
+        return self._key(os.path.relpath(dir_path, self.root_dir))
+
+    def _scan_folder(self, dir_path: Path) -> List[Path]:
+        """List valid media files directly inside a folder"""
+        files = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if is_media_file(entry.name) and entry.is_file():
+                    files.append(Path(entry.path))
+        return files
+
+    def build(self) -> None:
+        """Rebuild the index from the catalog if there is one, otherwise walk the tree"""
+        if self.catalog is not None:
+            try:
+                self._build_from_catalog()
+                return
+            except sqlite3.Error as e:
+                logger.error(f"Media catalog unavailable, falling back to a full walk: {e}")
+        self._build_from_walk()
+
+    def _build_from_catalog(self) -> None:
+        listing = self.catalog.scan(self.root_dir)
+        folders = {
+            key: MediaFolder([self.root_dir / key / name for name in names])
+            for key, names in listing.items() if names
+        }
+        with self._lock:
+            self._folders = folders
+        logger.info(
+            f"Indexed {sum(len(f) for f in folders.values())} files in {len(folders)} folders "
+            f"under {self.root_dir} from catalog"
+        )
+
+    def _build_from_walk(self) -> None:
+        folders: Dict[str, MediaFolder] = {}
+        total_files = 0
+
+        for dir_path, dir_names, _ in os.walk(self.root_dir):
+            # Don't descend into hidden directories
+            dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+            try:
+                files = self._scan_folder(Path(dir_path))
+            except OSError as e:
+                logger.error(f"Failed to scan {dir_path}: {e}")
+                continue
+            if files:
+                folders[self.key_for(dir_path)] = MediaFolder(files)
+                total_files += len(files)
+
+        with self._lock:
+            self._folders = folders
+
+        logger.info(f"Indexed {total_files} files in {len(folders)} folders under {self.root_dir}")
+
+    def refresh(self, subfolder: Optional[str] = None) -> None:
+        """Rescan a single folder, or the whole tree if no folder is given"""
+        if subfolder is None:
+            self.build()
+            return
+
+        key = self._key(subfolder)
+        dir_path = self.root_dir / key
+        try:
+            files = self._scan_folder(dir_path) if dir_path.is_dir() else []
+        except OSError as e:
+            logger.error(f"Failed to rescan {dir_path}: {e}")
+            return
+
+        with self._lock:
+            if files:
+                self._folders[key] = MediaFolder(files)
+            else:
+                self._folders.pop(key, None)
+        logger.debug(f"Refreshed {key}: {len(files)} files")
+
+    def add_file(self, path: Path) -> bool:
+        """Add a single file to the index, returning True if it was new"""
+        path = Path(path)
+        if not is_media_file(path.name):
+            return False
+        key = self.key_for(path.parent)
+        with self._lock:
+            folder = self._folders.get(key)
+            if folder is None:
+                folder = self._folders[key] = MediaFolder()
+            added = folder.add(path)
+        if added:
+            logger.debug(f"Indexed new file: {path}")
+        return added
+
+    def remove_file(self, path: Path) -> bool:
+        """Remove a single file from the index, returning True if it was indexed"""
+        path = Path(path)
+        key = self.key_for(path.parent)
+        with self._lock:
+            folder = self._folders.get(key)
+            if folder is None:
+                return False
+            removed = folder.remove(path.name)
+            if not folder:
+                del self._folders[key]
+            if removed:
+                self._drop_cluster_member(key, path)
+        if removed:
+            logger.debug(f"Dropped file from index: {path}")
+        return removed
+
+    def remove_tree(self, dir_path: Path) -> int:
+        """Drop a folder and everything below it, returning the folder count removed"""
+        key = self.key_for(dir_path)
+        prefix = f"{key}/" if key else ''
+        with self._lock:
+            doomed = [k for k in self._folders if k == key or k.startswith(prefix)]
+            for k in doomed:
+                folder = self._folders.pop(k)
+                if self._clusters:
+                    for path in folder.files:
+                        self._drop_cluster_member(k, path)
+        return len(doomed)
+
+    def _drop_cluster_member(self, key: str, path: Path) -> None:
+        """Forget a removed file's cluster membership; call with the lock held"""
+        cluster_id = self._clusters.pop(path, None)
+        if cluster_id is None:
+            return
+        remaining = self._cluster_sizes.get((key, cluster_id), 1) - 1
+        if remaining > 0:
+            self._cluster_sizes[(key, cluster_id)] = remaining
+        else:
+            self._cluster_sizes.pop((key, cluster_id), None)
+
+    def all_files(self) -> List[Path]:
+        """Get a snapshot of every indexed file"""
+        with self._lock:
+            return [path for folder in self._folders.values() for path in folder.files]
+
+    def get_files(self, subfolder: str) -> List[Path]:
+        """Get a copy of the indexed files for a folder"""
+        with self._lock:
+            folder = self._folders.get(self._key(subfolder))
+            return list(folder.files) if folder else []
+
+    def set_clusters(self, clusters: Dict[Path, int]) -> None:
+        """Register near-duplicate clusters so each cluster is picked like a single file"""
+        sizes: Dict[Tuple[str, int], int] = {}
+        for path, cluster_id in clusters.items():
+            key = (self.key_for(path.parent), cluster_id)
+            sizes[key] = sizes.get(key, 0) + 1
+        with self._lock:
+            self._clusters = dict(clusters)
+            self._cluster_sizes = sizes
+        logger.info(f"Loaded {len(set(clusters.values()))} duplicate clusters for {self.root_dir}")
+
+    def pick(self, subfolder: str) -> Optional[Path]:
+        """Pick a random file from a folder, or None if it has no files
+
+        Files in a duplicate cluster are accepted with probability
+        1/cluster size, so every cluster is as likely as one unique file.
+        """
+        key = self._key(subfolder)
+        with self._lock:
+            folder = self._folders.get(key)
+            if not folder:
+                return None
+
+            choice = random.choice(folder.files)
+            if not self._clusters:
+                return choice
+            for _ in range(16):
+                cluster_id = self._clusters.get(choice)
+                if cluster_id is None:
+                    return choice
+                members = self._cluster_sizes.get((key, cluster_id), 1)
+                if members <= 1 or random.random() * members < 1:
+                    return choice
+                choice = random.choice(folder.files)
+            return choice
+
+    def sample(self, subfolder: str, count: int) -> List[Path]:
+        """Pick up to count distinct files from a folder, at most one per duplicate cluster
+
+        Files are drawn one at a time and clusters weighted as in pick(),
+        so the cost follows count rather than the folder size. Files from
+        an already picked cluster only fill in when there aren't enough
+        distinct clusters to draw.
+        """
+        key = self._key(subfolder)
+        with self._lock:
+            folder = self._folders.get(key)
+            if not folder:
+                return []
+            files = folder.files
+            count = min(count, len(files))
+            if not self._clusters:
+                return random.sample(files, count)
+
+            picked: List[Path] = []
+            repeats: List[Path] = []
+            seen_clusters = set()
+            taken = set()  # Indexes already picked or set aside as repeats
+            for _ in range(count * 16):
+                if len(picked) == count or len(taken) == len(files):
+                    break
+                index = random.randrange(len(files))
+                if index in taken:
+                    continue
+                path = files[index]
+                cluster_id = self._clusters.get(path)
+                if cluster_id is not None:
+                    if cluster_id in seen_clusters:
+                        taken.add(index)
+                        repeats.append(path)
+                        continue
+                    members = self._cluster_sizes.get((key, cluster_id), 1)
+                    if members > 1 and random.random() * members >= 1:
+                        continue
+                    seen_clusters.add(cluster_id)
+                taken.add(index)
+                picked.append(path)
+
+            picked.extend(repeats[:count - len(picked)])
+            if len(picked) < count:
+                # Out of draws: top up from the files never looked at
+                rest = [path for index, path in enumerate(files) if index not in taken]
+                picked.extend(random.sample(rest, count - len(picked)))
+            return picked
+
+    def has_folder(self, subfolder: str) -> bool:
+        """Check whether a folder has any indexed files"""
+        with self._lock:
+            return self._key(subfolder) in self._folders
+
+    @property
+    def folder_count(self) -> int:
+        return len(self._folders)
+
+    @property
+    def file_count(self) -> int:
+        with self._lock:
+            return sum(len(folder) for folder in self._folders.values())
@@ -0,0 +1,297 @@
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .media_index import MediaIndex
+
+logger = logging.getLogger('MediaWatcher')
+
+# inotify event flags (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyLimitReached(OSError):
+    """Raised when the kernel refuses more watches, e.g. at fs.inotify.max_user_watches"""
+
+
+class InotifyBackend:
+    """Apply inotify events on the media tree to a MediaIndex"""
+
+    def __init__(self, index: MediaIndex):
+        self.index = index
+        self._libc = self._load_libc()
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, Path] = {}
+
+    @staticmethod
+    def _load_libc() -> ctypes.CDLL:
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("libc does not provide inotify")
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        return libc
+
+    def _watch(self, dir_path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOSPC, errno.ENOMEM):
+                raise InotifyLimitReached(error, f"Could not watch {dir_path}: {os.strerror(error)}")
+            # Usually a directory removed while we walked it
+            logger.warning(f"Could not watch {dir_path}: {os.strerror(error)}")
+            return
+        self._watches[wd] = dir_path
+
+    def _watch_tree(self, root: Path) -> None:
+        for dir_path, dir_names, _ in os.walk(root):
+            dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+            self._watch(Path(dir_path))
+
+    def start(self) -> None:
+        self._watch_tree(self.index.root_dir)
+        logger.info(f"Watching {len(self._watches)} directories with inotify")
+
+    def run(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], 1.0)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            try:
+                self._dispatch(data)
+            except InotifyLimitReached:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to apply media events: {e}", exc_info=True)
+
+    def _dispatch(self, data: bytes) -> None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            try:
+                self._handle(wd, mask, name)
+            except InotifyLimitReached:
+                raise
+            except OSError as e:
+                # One vanished path shouldn't cost the rest of the batch
+                logger.warning(f"Skipping media event for {name or wd}: {e}")
+
+    def _handle(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            logger.warning("inotify queue overflowed, rebuilding media index")
+            self.index.build()
+            return
+
+        if mask & IN_IGNORED:
+            self._watches.pop(wd, None)
+            return
+
+        dir_path = self._watches.get(wd)
+        if dir_path is None:
+            return
+
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            self.index.remove_tree(dir_path)
+            return
+
+        if not name or name.startswith('.'):
+            return
+        path = dir_path / name
+
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                # Files may already be inside a directory that was moved in
+                self._watch_tree(path)
+                for sub_dir, sub_names, _ in os.walk(path):
+                    sub_names[:] = [d for d in sub_names if not d.startswith('.')]
+                    self.index.refresh(self.index.key_for(Path(sub_dir)))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self.index.remove_tree(path)
+            return
+
+        # Wait for the writer to close the file instead of acting on IN_CREATE
+        if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            self.index.add_file(path)
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            self.index.remove_file(path)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingBackend:
+    """Detect media changes by polling directory mtimes"""
+
+    def __init__(self, index: MediaIndex, interval: float):
+        self.index = index
+        self.interval = interval
+        self._dir_mtimes: Dict[Path, int] = {}
+
+    def start(self) -> None:
+        for dir_path, dir_names, _ in os.walk(self.index.root_dir):
+            dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+            self._remember(Path(dir_path))
+        logger.info(
+            f"Polling {len(self._dir_mtimes)} directories every {self.interval:.1f}s for media changes"
+        )
+
+    def _remember(self, dir_path: Path) -> None:
+        try:
+            self._dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            self._dir_mtimes.pop(dir_path, None)
+
+    def run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Media poll failed: {e}", exc_info=True)
+
+    def poll(self) -> None:
+        """Stat every known directory and rescan only the ones that changed"""
+        for dir_path, last_mtime in list(self._dir_mtimes.items()):
+            try:
+                mtime = os.stat(dir_path).st_mtime_ns
+            except FileNotFoundError:
+                del self._dir_mtimes[dir_path]
+                self.index.remove_tree(dir_path)
+                continue
+            if mtime != last_mtime:
+                self._dir_mtimes[dir_path] = mtime
+                self._rescan(dir_path)
+
+    def _rescan(self, dir_path: Path) -> None:
+        """Diff one directory against the index and apply the deltas"""
+        key = self.index.key_for(dir_path)
+        indexed = {p.name for p in self.index.get_files(key)}
+        on_disk = set()
+
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    sub_dir = Path(entry.path)
+                    if sub_dir not in self._dir_mtimes:
+                        self._discover(sub_dir)
+                elif entry.is_file():
+                    on_disk.add(entry.name)
+
+        for name in on_disk - indexed:
+            self.index.add_file(dir_path / name)
+        for name in indexed - on_disk:
+            self.index.remove_file(dir_path / name)
+
+    def _discover(self, root: Path) -> None:
+        """Start tracking a new directory tree and index what is already in it"""
+        for dir_path, dir_names, _ in os.walk(root):
+            dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+            self._remember(Path(dir_path))
+            self.index.refresh(self.index.key_for(Path(dir_path)))
+
+    def close(self) -> None:
+        self._dir_mtimes.clear()
+
+
+class MediaWatcher:
+    """Background thread keeping a MediaIndex in sync with the filesystem"""
+
+    def __init__(self, index: MediaIndex, poll_interval: float = 5.0, use_inotify: bool = True):
+        self.index = index
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._backend = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _create_backend(self):
+        if self.use_inotify:
+            try:
+                return InotifyBackend(self.index)
+            except OSError as e:
+                logger.info(f"inotify unavailable ({e}), falling back to polling")
+        return PollingBackend(self.index, self.poll_interval)
+
+    def _fall_back_to_polling(self, reason: Exception) -> None:
+        logger.warning(f"{reason}; falling back to polling")
+        self._backend.close()
+        self._backend = PollingBackend(self.index, self.poll_interval)
+        self._backend.start()
+
+    def start(self) -> None:
+        """Start watching the index root in a daemon thread"""
+        if self._thread is not None:
+            return
+        self._backend = self._create_backend()
+        try:
+            self._backend.start()
+        except InotifyLimitReached as e:
+            self._fall_back_to_polling(e)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"MediaWatcher[{self.index.root_dir}]",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            try:
+                self._backend.run(self._stop)
+            except InotifyLimitReached as e:
+                self._fall_back_to_polling(e)
+                # Whatever inotify failed to pick up is found by one full rescan
+                self.index.refresh()
+                self._backend.run(self._stop)
+        except Exception as e:
+            logger.error(f"Media watcher stopped unexpectedly: {e}", exc_info=True)
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release its resources"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._backend.close()
+        self._thread = None
+        self._backend = None
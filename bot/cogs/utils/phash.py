@@ -0,0 +1,190 @@
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, duplicate detection is unavailable without it
+    Image = None
+
+logger = logging.getLogger('PerceptualHash')
+
+T = TypeVar('T')
+
+HASH_SIZE = 8
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS phashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    phash INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS duplicate_clusters (
+    path TEXT PRIMARY KEY,
+    cluster_id INTEGER NOT NULL
+);
+"""
+
+
+def dhash(file_path: str) -> Optional[int]:
+    """Compute a 64-bit difference hash of an image (first frame for animations)
+
+    Runs in a worker process. Returns None if the file can't be decoded.
+    """
+    try:
+        with Image.open(file_path) as img:
+            img = img.convert('L').resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS)
+            pixels = list(img.getdata())
+    except (OSError, ValueError):
+        return None
+
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def _to_signed(value: int) -> int:
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class BKTree(Generic[T]):
+    """BK-tree over 64-bit hashes for Hamming-distance range queries"""
+
+    def __init__(self):
+        # Each node is (hash, items, children keyed by distance)
+        self._root: Optional[Tuple[int, List[T], Dict[int, tuple]]] = None
+        self.size = 0
+
+    def add(self, value: int, item: T) -> None:
+        self.size += 1
+        if self._root is None:
+            self._root = (value, [item], {})
+            return
+
+        node = self._root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (value, [item], {})
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> List[Tuple[int, T]]:
+        """Find every item whose hash is within max_distance of value"""
+        if self._root is None:
+            return []
+
+        results = []
+        stack = [self._root]
+        while stack:
+            node_value, items, children = stack.pop()
+            distance = hamming(value, node_value)
+            if distance <= max_distance:
+                results.extend((distance, item) for item in items)
+            # Triangle inequality: only children in this band can hold matches
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return results
+
+
+def cluster_hashes(hashes: Dict[str, int], max_distance: int) -> List[List[str]]:
+    """Group paths whose hashes are within max_distance of each other (transitively)"""
+    tree: BKTree[str] = BKTree()
+    for path, value in hashes.items():
+        tree.add(value, path)
+
+    parent = {path: path for path in hashes}
+
+    def find(path: str) -> str:
+        while parent[path] != path:
+            parent[path] = parent[parent[path]]
+            path = parent[path]
+        return path
+
+    for path, value in hashes.items():
+        for _, other in tree.search(value, max_distance):
+            root_a, root_b = find(path), find(other)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+    groups: Dict[str, List[str]] = {}
+    for path in hashes:
+        groups.setdefault(find(path), []).append(path)
+    return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+class PerceptualHashStore:
+    """SQLite store of perceptual hashes and the duplicate clusters built from them"""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load_hashes(self) -> Dict[str, Tuple[int, int, int]]:
+        """Get path -> (size, mtime_ns, phash) for every stored hash"""
+        with self._connect() as conn:
+            return {
+                path: (size, mtime_ns, _to_unsigned(phash))
+                for path, size, mtime_ns, phash in conn.execute(
+                    "SELECT path, size, mtime_ns, phash FROM phashes")
+            }
+
+    def save_hashes(self, rows: List[Tuple[str, int, int, int]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO phashes (path, size, mtime_ns, phash) VALUES (?, ?, ?, ?)",
+                [(path, size, mtime_ns, _to_signed(phash)) for path, size, mtime_ns, phash in rows]
+            )
+
+    def save_clusters(self, clusters: List[List[str]]) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM duplicate_clusters")
+            conn.executemany(
+                "INSERT INTO duplicate_clusters (path, cluster_id) VALUES (?, ?)",
+                [(path, cluster_id) for cluster_id, paths in enumerate(clusters) for path in paths]
+            )
+
+    def load_clusters(self, root_dir: Path) -> Dict[Path, int]:
+        """Get the cluster id of every clustered file under a root, as root-relative index paths"""
+        root_dir = Path(root_dir)
+        prefix = os.path.join(str(root_dir.resolve()), '')
+        clusters: Dict[Path, int] = {}
+        with self._connect() as conn:
+            for path, cluster_id in conn.execute(
+                    "SELECT path, cluster_id FROM duplicate_clusters WHERE substr(path, 1, ?) = ?",
+                    (len(prefix), prefix)):
+                clusters[root_dir / path[len(prefix):]] = cluster_id
+        return clusters
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from .handlers import ImageHandler
+from .io_pool import IOPoolSaturated
+
+logger = logging.getLogger('ImagePrefetcher')
+
+
+class PrefetchedImage(NamedTuple):
+    filename: str
+    file_path: Path
+    content_hash: str
+    data: bytes
+
+
+class ImagePrefetcher:
+    """Pick and read the next random image for a folder ahead of time
+
+    At most one image is held per folder. Held bytes are capped at
+    ``max_bytes``; when a new prefetch would go over the cap, the oldest
+    held images are dropped and, if that is not enough, in-flight
+    prefetches are cancelled.
+    """
+
+    def __init__(self, image_handler: ImageHandler, max_bytes: int = 64 * 1024 * 1024, max_in_flight: int = 8):
+        self.image_handler = image_handler
+        self.max_bytes = max_bytes
+        self.max_in_flight = max_in_flight
+        self._ready: 'OrderedDict[str, PrefetchedImage]' = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.ready_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+
+    def take(self, folder: str) -> Optional[PrefetchedImage]:
+        """Claim the prefetched image for a folder, if one is ready"""
+        image = self._ready.pop(folder, None)
+        if image is None:
+            self.misses += 1
+            return None
+        self.ready_bytes -= len(image.data)
+        self.hits += 1
+        return image
+
+    def schedule(self, folder: str) -> None:
+        """Start prefetching the next image for a folder in the background"""
+        if folder in self._ready or folder in self._tasks:
+            return
+        if len(self._tasks) >= self.max_in_flight:
+            return
+        self._tasks[folder] = asyncio.create_task(self._prefetch(folder), name=f"prefetch:{folder}")
+
+    async def _prefetch(self, folder: str) -> None:
+        try:
+            filename, file_path = await self.image_handler.get_random_image_async(folder)
+            content_hash = await self.image_handler.content_hash(file_path)
+            data = await self.image_handler.read_file(file_path, content_hash)
+            self._store(folder, PrefetchedImage(filename, file_path, content_hash, data))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except IOPoolSaturated:
+            logger.debug(f"Skipped prefetch for {folder}: I/O pool saturated")
+        except Exception as e:
+            logger.debug(f"Prefetch failed for {folder}: {e}")
+        finally:
+            self._tasks.pop(folder, None)
+
+    def _store(self, folder: str, image: PrefetchedImage) -> None:
+        size = len(image.data)
+        if size > self.max_bytes:
+            return
+
+        # Drop the oldest held images until the new one fits
+        while self._ready and self.ready_bytes + size > self.max_bytes:
+            _, evicted = self._ready.popitem(last=False)
+            self.ready_bytes -= len(evicted.data)
+
+        self._ready[folder] = image
+        self.ready_bytes += size
+
+        if self.ready_bytes >= self.max_bytes:
+            self._relieve_pressure()
+
+    def _relieve_pressure(self) -> None:
+        """Cancel in-flight prefetches while held images are at the memory cap"""
+        current = asyncio.current_task()
+        for task in list(self._tasks.values()):
+            if task is not current and not task.done():
+                task.cancel()
+        logger.debug(f"Prefetch memory cap reached ({self.ready_bytes} bytes), cancelled in-flight prefetches")
+
+    def cancel_all(self) -> None:
+        """Cancel every prefetch and drop everything held"""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._ready.clear()
+        self.ready_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'ready': len(self._ready),
+            'ready_bytes': self.ready_bytes,
+            'in_flight': len(self._tasks),
+            'hits': self.hits,
+            'misses': self.misses,
+            'cancelled': self.cancelled,
+        }
@@ -0,0 +1,257 @@
+import logging
+import random
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .autocomplete import AutocompleteEngine
+from .character_data import load_character_data
+from .handlers import CharacterInfo, create_character_info
+
+logger = logging.getLogger('CharacterRegistry')
+
+
+def normalize_series_name(series: str) -> str:
+    """Normalize series name for consistent matching"""
+    if not series:
+        return ""
+
+    # Handle special case for dota2
+    if series.lower() in ['dota2', 'dota 2', 'dota_2']:
+        return 'dota2'
+
+    return series.lower().replace(' ', '_').strip()
+
+
+class CharacterRegistry:
+    """All known characters with lookup indexes
+
+    Lookups by series, id, title or alias are plain dict hits, so
+    autocomplete and command handlers never scan the whole catalog.
+    Series names are known straight away; the records and indexes are
+    built on first use, or ahead of time with ensure_built(). The
+    autocomplete engines are built ahead of time with build_autocomplete().
+    """
+
+    def __init__(self, descriptions: dict, mappings: dict):
+        self._characters: Dict[str, CharacterInfo] = {}  # unique_id -> character
+        self._by_series: Dict[str, List[str]] = {}  # series -> unique_ids sorted by title
+        self._by_name: Dict[Tuple[str, str], str] = {}  # (series, id/title/alias) -> unique_id
+        self._by_any_name: Dict[str, str] = {}  # id/title/alias in any series -> unique_id
+        self.series_display_names: Dict[str, str] = {}
+        self._engines: Dict[str, AutocompleteEngine] = {}
+        self._global_engine: Optional[AutocompleteEngine] = None
+        self._sources: List[Tuple[str, str, dict, dict]] = []
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._autocomplete_built = False
+
+        for source, series_descriptions in descriptions.items():
+            series = normalize_series_name(source)
+            mapping_data = mappings.get(series, mappings.get(source, {}))
+            if not mapping_data:
+                logger.warning(f"No mapping data found for {source}, skipping")
+                continue
+            self._sources.append((source, series, series_descriptions, mapping_data))
+            self.series_display_names[series] = 'Dota 2' if series == 'dota2' else source.replace('_', ' ').title()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the records and indexes have been built"""
+        return self._built
+
+    def ensure_built(self) -> 'CharacterRegistry':
+        """Build the records and indexes if that hasn't happened yet; safe to call from any thread"""
+        if not self._built:
+            with self._build_lock:
+                if not self._built:
+                    self._build()
+                    self._built = True
+        return self
+
+    @property
+    def autocomplete_ready(self) -> bool:
+        """Whether every completion engine has been built"""
+        return self._autocomplete_built
+
+    def build_autocomplete(self) -> 'CharacterRegistry':
+        """Build the global and per-series completion engines (blocking, safe from any thread)
+
+        Building them takes seconds on a large catalog, far too long for an
+        autocomplete handler on the event loop, so this runs in the
+        background and handlers return nothing until it's done.
+        """
+        self.ensure_built()
+        with self._build_lock:
+            if self._autocomplete_built:
+                return self
+            engines = {
+                series: self._series_engine(series) for series in self._by_series
+            }
+            self._global_engine = self._global_engine or self._make_global_engine()
+            self._engines = engines
+            self._autocomplete_built = True
+        logger.info(f"Built autocomplete for {len(engines)} series")
+        return self
+
+    @property
+    def characters(self) -> Dict[str, CharacterInfo]:
+        return self.ensure_built()._characters
+
+    @property
+    def by_series(self) -> Dict[str, List[str]]:
+        return self.ensure_built()._by_series
+
+    @property
+    def by_name(self) -> Dict[Tuple[str, str], str]:
+        return self.ensure_built()._by_name
+
+    @property
+    def by_any_name(self) -> Dict[str, str]:
+        return self.ensure_built()._by_any_name
+
+    def _build(self) -> None:
+        total_characters = 0
+
+        for source, series, series_descriptions, mapping_data in self._sources:
+            all_char_ids = set(series_descriptions.keys()) | set(mapping_data.keys())
+            total_characters += len(all_char_ids)
+            for char_id in sorted(all_char_ids):
+                desc_data = series_descriptions.get(char_id) or (char_id.title(), f"Character from {source}")
+                char_info = create_character_info(
+                    char_id=char_id,
+                    source=series,
+                    desc_data=desc_data,
+                    mapping_data={char_id: mapping_data.get(char_id, [char_id])}
+                )
+                if char_info is None:
+                    logger.warning(f"Failed to create character info for {char_id} from {source}")
+                    continue
+                unique_id = f"{series}:{char_id.lower()}"
+                self._characters[unique_id] = char_info
+                self._by_series.setdefault(series, []).append(unique_id)
+
+        for series, unique_ids in self._by_series.items():
+            unique_ids.sort(key=lambda uid: self._characters[uid].title)
+        self._index_names()
+        # The raw tables are no longer needed once everything is indexed
+        self._sources = []
+
+        logger.info(
+            f"Registry loaded {len(self._characters)}/{total_characters} characters "
+            f"across {len(self._by_series)} series"
+        )
+
+    def _index_names(self) -> None:
+        """Index ids, then titles, then aliases so a weaker match never shadows a stronger one"""
+        passes = (
+            lambda uid, info: (uid.split(':', 1)[1], info.name),
+            lambda uid, info: (info.title,),
+            lambda uid, info: info.aliases,
+        )
+        for names_of in passes:
+            for unique_id, char_info in self._characters.items():
+                series = unique_id.split(':', 1)[0]
+                for name in names_of(unique_id, char_info):
+                    self._by_name.setdefault((series, name.lower()), unique_id)
+                    self._by_any_name.setdefault(name.lower(), unique_id)
+
+    @property
+    def series(self) -> List[str]:
+        return list(self.series_display_names)
+
+    def get_characters_for_series(self, series: str) -> List[CharacterInfo]:
+        """Get all characters for a series, sorted by title"""
+        unique_ids = self.by_series.get(normalize_series_name(series), ())
+        return [self.characters[uid] for uid in unique_ids]
+
+    def find_id(self, series: str, character_name: str) -> Optional[str]:
+        """Resolve a character id, title or alias within a series to its unique id"""
+        if not series or not character_name:
+            return None
+        return self.by_name.get((normalize_series_name(series), character_name.lower().strip()))
+
+    def find_character(self, series: str, character_name: str) -> Optional[CharacterInfo]:
+        """Find a specific character by series and id, title or alias"""
+        unique_id = self.find_id(series, character_name)
+        return self.characters[unique_id] if unique_id else None
+
+    def resolve(self, character_name: str, series: Optional[str] = None) -> Optional[CharacterInfo]:
+        """Find a character from a 'series:character' value, or by name in one series or all of them"""
+        if not character_name:
+            return None
+        name = character_name.lower().strip()
+        if ':' in name:
+            series_part, char_part = name.split(':', 1)
+            if normalize_series_name(series_part) in self.by_series:
+                return self.find_character(series_part, char_part)
+        if series:
+            return self.find_character(series, name)
+        unique_id = self.by_any_name.get(name)
+        return self.characters[unique_id] if unique_id else None
+
+    def _make_global_engine(self) -> AutocompleteEngine:
+        return AutocompleteEngine(
+            (f"{char.title} ({self.series_display_names[unique_id.split(':', 1)[0]]})",
+             unique_id, (char.title, char.name, *char.aliases))
+            for unique_id, char in self.characters.items()
+        )
+
+    def _series_engine(self, series_key: str) -> AutocompleteEngine:
+        return AutocompleteEngine(
+            (char.title, char.title, (char.name, *char.aliases))
+            for char in self.get_characters_for_series(series_key)
+        )
+
+    def global_autocomplete(self) -> AutocompleteEngine:
+        """Get the completion engine over every series, building it on first use
+
+        Choices are labelled with their series and carry 'series:character'
+        values, which resolve() understands.
+        """
+        if self._global_engine is None:
+            self._global_engine = self._make_global_engine()
+        return self._global_engine
+
+    def autocomplete(self, series: str) -> Optional[AutocompleteEngine]:
+        """Get the name completion engine for a series, building it on first use"""
+        series_key = normalize_series_name(series)
+        engine = self._engines.get(series_key)
+        if engine is None and series_key in self.by_series:
+            engine = self._engines[series_key] = self._series_engine(series_key)
+        return engine
+
+    def random_character(self, series: Optional[str] = None) -> Optional[CharacterInfo]:
+        """Pick a random character, optionally from one series"""
+        series_key = normalize_series_name(series) if series else random.choice(self.series)
+        unique_ids = self.by_series.get(series_key)
+        if not unique_ids:
+            return None
+        return self.characters[random.choice(unique_ids)]
+
+
+_registry: Optional[CharacterRegistry] = None
+
+
+def build_registry() -> CharacterRegistry:
+    """Build a fresh registry from the character data file"""
+    # Loaded straight from the data file so the raw tables are freed once indexed
+    return CharacterRegistry(*load_character_data())
+
+
+def get_registry() -> CharacterRegistry:
+    """Get the registry shared by every cog, building it on first use"""
+    global _registry
+    if _registry is None:
+        _registry = build_registry()
+    return _registry
+
+
+def set_registry(registry: CharacterRegistry) -> Optional[CharacterRegistry]:
+    """Swap in a new registry and return the previous one
+
+    Registries are never mutated after they are built, so code that
+    already fetched the old one keeps working against that snapshot.
+    """
+    global _registry
+    previous, _registry = _registry, registry
+    return previous
@@ -0,0 +1,80 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+logger = logging.getLogger('StartupProfile')
+
+
+class StartupBudgetExceeded(Exception):
+    """Raised when startup took longer than the configured budget"""
+
+
+class StartupProfiler:
+    """Times named startup phases and reports them against a budget
+
+    The clock starts when this module is first imported, which is the
+    first thing the bot package does. Sequential phases add up to the
+    total; concurrent ones (per-cog loads, background builds) overlap
+    them, so they are listed separately and not counted.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.concurrent_phases: List[Tuple[str, float]] = []
+        self.finished_at: float = 0.0
+
+    @contextmanager
+    def phase(self, name: str, concurrent: bool = False) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, concurrent=concurrent)
+
+    def record(self, name: str, seconds: float, concurrent: bool = False) -> None:
+        (self.concurrent_phases if concurrent else self.phases).append((name, seconds))
+
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started
+
+    def finish(self) -> float:
+        """Stop the clock and return the total startup time"""
+        if not self.finished_at:
+            self.finished_at = time.perf_counter()
+        return self.elapsed()
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.finished_at)
+
+    def report(self) -> str:
+        total = self.elapsed()
+        width = max((len(name) for name, _ in self.phases + self.concurrent_phases), default=7)
+        lines = [f"Startup breakdown ({total:.2f}s total):"]
+        for name, seconds in self.phases:
+            share = seconds / total if total else 0.0
+            lines.append(f"  {name:<{width}}  {seconds * 1000:>9.1f} ms  {share:>6.1%}")
+        unaccounted = total - sum(seconds for _, seconds in self.phases)
+        lines.append(f"  {'(other)':<{width}}  {unaccounted * 1000:>9.1f} ms")
+        if self.concurrent_phases:
+            lines.append("Concurrent with the above (not counted):")
+            for name, seconds in self.concurrent_phases:
+                lines.append(f"  {name:<{width}}  {seconds * 1000:>9.1f} ms")
+        return "\n".join(lines)
+
+    def check_budget(self, budget: float) -> bool:
+        """Log the breakdown and whether startup fit in budget seconds (0 disables the check)"""
+        logger.info(self.report())
+        if budget <= 0:
+            return True
+        total = self.elapsed()
+        if total > budget:
+            logger.error(f"Startup took {total:.2f}s, over the {budget:.2f}s budget")
+            return False
+        logger.info(f"Startup took {total:.2f}s, within the {budget:.2f}s budget")
+        return True
+
+
+startup_profiler = StartupProfiler()
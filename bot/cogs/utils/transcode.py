@@ -0,0 +1,246 @@
+import asyncio
+import io
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from .disk_cache import DiskCache
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:  # Pillow is optional, oversized files just can't be shrunk without it
+    Image = ImageSequence = None
+
+logger = logging.getLogger('MediaTranscoder')
+
+MiB = 1024 * 1024
+
+ANIMATION_FORMATS = ('webp', 'mp4')
+
+# Upload limits we build variants for, smallest first
+VARIANT_TIERS = (10 * MiB, 25 * MiB, 50 * MiB, 100 * MiB)
+
+# Room left under a tier for the multipart envelope and embed payload
+UPLOAD_OVERHEAD = 64 * 1024
+
+WEBP_MAX_DIMENSION = 16383
+
+
+class MediaTooLarge(Exception):
+    """Raised when a file is over the upload limit and no variant fits"""
+
+
+def make_size_variant(src_path: str, dst_path: str, max_bytes: int) -> Optional[int]:
+    """Write a WebP copy of a still image that fits in max_bytes
+
+    Runs in a worker process. Quality is lowered first, then the image is
+    downscaled until it fits. Returns the variant size, or None if the
+    source is animated or could not be made small enough.
+    """
+    with Image.open(src_path) as img:
+        if getattr(img, 'is_animated', False):
+            return None
+
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+
+        scale = min(1.0, WEBP_MAX_DIMENSION / max(img.size))
+        quality = 90
+        for _ in range(12):
+            frame = img
+            if scale < 1.0:
+                size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+                frame = img.resize(size, Image.LANCZOS)
+
+            buffer = io.BytesIO()
+            frame.save(buffer, 'WEBP', quality=quality, method=4)
+            if buffer.tell() <= max_bytes:
+                tmp_path = f"{dst_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(buffer.getbuffer())
+                os.replace(tmp_path, dst_path)
+                return buffer.tell()
+
+            if quality > 60:
+                quality -= 15
+            else:
+                # Scale by roughly how far over budget we are
+                scale *= min(0.9, max(0.5, (max_bytes / buffer.tell()) ** 0.5))
+
+    return None
+
+
+def transcode_animation(src_path: str, dst_path: str, fmt: str) -> Optional[int]:
+    """Re-encode an animated GIF as animated WebP or MP4
+
+    Runs in a worker process. WebP is written with Pillow, MP4 with
+    ffmpeg. Returns the output size, or None if the source isn't animated
+    or the encoder isn't available.
+    """
+    tmp_path = f"{dst_path}.tmp"
+
+    if fmt == 'mp4':
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            return None
+        result = subprocess.run(
+            [ffmpeg, '-y', '-loglevel', 'error', '-i', src_path,
+             '-movflags', '+faststart', '-pix_fmt', 'yuv420p',
+             '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+             '-c:v', 'libx264', '-crf', '23', '-an', '-f', 'mp4', tmp_path],
+            capture_output=True, timeout=300
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode(errors='replace').strip())
+    elif fmt == 'webp':
+        with Image.open(src_path) as img:
+            if not getattr(img, 'is_animated', False):
+                return None
+            frames, durations = [], []
+            for frame in ImageSequence.Iterator(img):
+                frames.append(frame.convert('RGBA'))
+                durations.append(frame.info.get('duration', 100))
+            frames[0].save(
+                tmp_path, 'WEBP', save_all=True, append_images=frames[1:],
+                duration=durations, loop=img.info.get('loop', 0), quality=80, method=4
+            )
+    else:
+        raise ValueError(f"Unsupported animation format: {fmt}")
+
+    os.replace(tmp_path, dst_path)
+    return os.path.getsize(dst_path)
+
+
+def tier_for_limit(limit: int) -> int:
+    """Pick the largest variant tier that fits under an upload limit"""
+    fitting = [tier for tier in VARIANT_TIERS if tier <= limit]
+    return fitting[-1] if fitting else limit
+
+
+class MediaTranscoder:
+    """Build and cache smaller variants of media files in a process pool"""
+
+    def __init__(self, cache: DiskCache, max_workers: int = 2):
+        self.cache = cache
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, asyncio.Future] = {}
+        self._failed: Set[str] = set()
+        self._background: Dict[str, asyncio.Task] = {}
+        if Image is None:
+            logger.warning("Pillow is not installed, oversized images will not be downscaled")
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    @staticmethod
+    def variant_key(content_hash: str, tier: int) -> str:
+        """Cache key for the bytes of a size variant; its file is named after it"""
+        return f"{content_hash}.{tier}"
+
+    @staticmethod
+    def variant_name(content_hash: str, tier: int) -> str:
+        return f"{MediaTranscoder.variant_key(content_hash, tier)}.webp"
+
+    @staticmethod
+    def animation_name(content_hash: str, fmt: str) -> str:
+        return f"{content_hash}.anim.{fmt}"
+
+    def find_variant(self, content_hash: str, limit: int) -> Optional[Path]:
+        """Get the largest cached size variant that fits under a limit"""
+        for tier in sorted({*VARIANT_TIERS, limit}, reverse=True):
+            if tier <= limit:
+                path = self.cache.get(self.variant_name(content_hash, tier))
+                if path is not None:
+                    return path
+        return None
+
+    async def _run_job(self, name: str, func, *args) -> Optional[Path]:
+        """Run a transcoding job once per output name, sharing it between callers"""
+        if name in self._failed:
+            return None
+
+        job = self._jobs.get(name)
+        if job is None:
+            loop = asyncio.get_running_loop()
+            job = loop.run_in_executor(self._get_pool(), func, *args)
+            self._jobs[name] = job
+            job.add_done_callback(lambda _: self._jobs.pop(name, None))
+
+        try:
+            # Shield so one cancelled interaction doesn't kill a job others are waiting on
+            result = await asyncio.shield(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Transcoding job {name} failed: {e}")
+            self._failed.add(name)
+            return None
+
+        if result is None:
+            self._failed.add(name)
+            return None
+        if name not in self.cache:
+            self.cache.add(name)
+        return self.cache.path_for(name)
+
+    def can_transcode(self, fmt: str) -> bool:
+        """Check whether the encoder for an animation format is available"""
+        if fmt == 'mp4':
+            return shutil.which('ffmpeg') is not None
+        return fmt == 'webp' and self.enabled
+
+    def find_animation(self, content_hash: str, fmt: str) -> Optional[Path]:
+        """Get a cached WebP/MP4 encoding of a GIF without building one"""
+        return self.cache.get(self.animation_name(content_hash, fmt))
+
+    def schedule_animation(self, file_path: Path, content_hash: str, fmt: str) -> None:
+        """Start encoding a GIF in the background so a later send can use it"""
+        name = self.animation_name(content_hash, fmt)
+        if (name in self._background or name in self._jobs or name in self._failed
+                or name in self.cache or not self.can_transcode(fmt)):
+            return
+        task = asyncio.create_task(self.animation_for(file_path, content_hash, fmt))
+        self._background[name] = task
+        task.add_done_callback(lambda _: self._background.pop(name, None))
+
+    async def animation_for(self, file_path: Path, content_hash: str, fmt: str) -> Optional[Path]:
+        """Get a GIF re-encoded as WebP or MP4, building it if needed"""
+        name = self.animation_name(content_hash, fmt)
+        existing = self.cache.get(name)
+        if existing is not None or not self.can_transcode(fmt):
+            return existing
+        return await self._run_job(
+            name, transcode_animation,
+            str(file_path), str(self.cache.path_for(name)), fmt
+        )
+
+    async def variant_for(self, file_path: Path, content_hash: str, limit: int) -> Optional[Path]:
+        """Get a size variant that fits under a limit, building it if needed"""
+        existing = self.find_variant(content_hash, limit)
+        if existing is not None or not self.enabled:
+            return existing
+
+        tier = tier_for_limit(limit)
+        name = self.variant_name(content_hash, tier)
+        return await self._run_job(
+            name, make_size_variant,
+            str(file_path), str(self.cache.path_for(name)), tier - UPLOAD_OVERHEAD
+        )
+
+    def shutdown(self) -> None:
+        for task in self._background.values():
+            task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
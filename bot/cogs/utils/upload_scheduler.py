@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List, Tuple
+
+logger = logging.getLogger('UploadScheduler')
+
+
+class UploadQueueFull(Exception):
+    """Raised when an upload can't be started soon enough to be worth waiting for"""
+
+
+class UploadScheduler:
+    """Admits Discord uploads under a global and a per-route concurrency limit
+
+    Waiting uploads are ordered by size class, so a quick image isn't
+    stuck behind a batch of large videos, and first come first served
+    within a class. At most ``max_queue`` uploads may wait; beyond that,
+    or once an upload has waited ``max_wait`` seconds, UploadQueueFull is
+    raised so the caller can answer "busy" while the interaction token
+    is still good.
+    """
+
+    def __init__(self, max_concurrent: int = 4, per_route: int = 2,
+                 max_queue: int = 32, max_wait: float = 60.0):
+        self.max_concurrent = max_concurrent
+        self.per_route = per_route
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._active = 0
+        self._route_active: Dict[Hashable, int] = {}
+        self._waiters: List[Tuple[int, int, Hashable, asyncio.Future]] = []  # (size class, seq, route, future)
+        self._waiting = 0
+        self._seq = itertools.count()
+
+        self.started = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of uploads waiting for a slot"""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Number of uploads currently sending"""
+        return self._active
+
+    @property
+    def saturated(self) -> bool:
+        """Whether a new upload would be turned away right now"""
+        return self._waiting >= self.max_queue
+
+    @staticmethod
+    def size_class(size: int) -> int:
+        # Powers of two: files of similar size keep their arrival order
+        return max(size, 0).bit_length()
+
+    def _has_capacity(self, route: Hashable) -> bool:
+        return self._active < self.max_concurrent and self._route_active.get(route, 0) < self.per_route
+
+    def _start(self, route: Hashable) -> None:
+        self._active += 1
+        self._route_active[route] = self._route_active.get(route, 0) + 1
+        self.started += 1
+
+    def _wake(self) -> None:
+        """Hand free slots to the smallest waiting uploads whose route has room"""
+        blocked = []
+        while self._waiters and self._active < self.max_concurrent:
+            entry = heapq.heappop(self._waiters)
+            route, future = entry[2], entry[3]
+            if future.done():
+                continue  # Gave up waiting
+            if self._route_active.get(route, 0) >= self.per_route:
+                blocked.append(entry)
+                continue
+            self._waiting -= 1
+            self._start(route)
+            future.set_result(None)
+        for entry in blocked:
+            heapq.heappush(self._waiters, entry)
+
+    async def acquire(self, route: Hashable, size: int) -> None:
+        """Wait for an upload slot on route, or raise UploadQueueFull"""
+        if not self._waiting and self._has_capacity(route):
+            self._start(route)
+            return
+
+        if self.saturated:
+            self.rejected += 1
+            logger.warning(f"Upload queue full ({self._waiting} waiting, {self._active} sending)")
+            raise UploadQueueFull("Too many uploads are queued")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (self.size_class(size), next(self._seq), route, future))
+        self._waiting += 1
+        # Other routes may have room even while this one's earlier uploads are blocked
+        self._wake()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as we stopped waiting; give it back
+                self.release(route)
+            else:
+                self._waiting -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.timed_out += 1
+                logger.warning(f"Upload waited over {self.max_wait:g}s for a slot, giving up")
+                raise UploadQueueFull("Timed out waiting for an upload slot") from None
+            raise
+        finally:
+            self.total_wait += time.perf_counter() - started
+
+    def release(self, route: Hashable) -> None:
+        self._active -= 1
+        remaining = self._route_active.get(route, 1) - 1
+        if remaining:
+            self._route_active[route] = remaining
+        else:
+            self._route_active.pop(route, None)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, route: Hashable, size: int) -> AsyncIterator[None]:
+        """Hold an upload slot for the duration of the block"""
+        await self.acquire(route, size)
+        try:
+            yield
+        finally:
+            self.release(route)
+
+    def stats(self) -> Dict[str, float]:
+        queued = self.started + self.timed_out
+        return {
+            'in_flight': self._active,
+            'queue_depth': self._waiting,
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'started': self.started,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'avg_wait': self.total_wait / queued if queued else 0.0,
+        }
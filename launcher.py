@@ -1,11 +1,18 @@
 from pathlib import Path
+import argparse
 import asyncio
 import logging
+import multiprocessing
 import sys
 import signal
-from typing import Optional
+import time
+from typing import List, Optional, Tuple
+
+import aiohttp
 
 from bot import HentaiBot
+from bot.bot import BotConfig
+from bot.cogs.utils.startup_profile import StartupBudgetExceeded
 
 # Configure logging for the launcher
 logging.basicConfig(
@@ -19,6 +26,15 @@ logging.basicConfig(
 
 logger = logging.getLogger('BotLauncher')
 
+DISCORD_API = "https://discord.com/api/v10"
+
+# Discord allows max_concurrency shard identifies per this many seconds
+IDENTIFY_INTERVAL = 5.0
+
+# A cluster that dies sooner than this after starting is not restarted
+MIN_CLUSTER_UPTIME = 60.0
+CLUSTER_RESTART_DELAY = 5.0
+
 
 class GracefulKiller:
     """Handle graceful shutdown on SIGINT and SIGTERM."""
@@ -47,12 +63,18 @@ async def shutdown_handler(bot: HentaiBot, killer: GracefulKiller) -> None:
         raise
 
 
-async def main():
+async def main(shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None,
+               cluster_id: Optional[int] = None, killer: Optional[GracefulKiller] = None):
     """Main entry point for the bot."""
+    bot = None
     try:
-        bot = HentaiBot()
+        bot = HentaiBot(shard_ids=shard_ids, shard_count=shard_count, cluster_id=cluster_id)
+        if killer is not None:
+            asyncio.create_task(shutdown_handler(bot, killer))
         async with bot:
             await bot.start()
+        if bot.startup_budget_exceeded:
+            raise StartupBudgetExceeded(f"Startup exceeded its {bot.config.startup_budget:.2f}s budget")
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
         if bot:
@@ -65,9 +87,111 @@ async def main():
     finally:
         logger.info("Bot shutdown complete")
 
+async def gateway_info(token: str) -> Tuple[int, int]:
+    """Ask Discord for the recommended shard count and identify concurrency"""
+    headers = {"Authorization": f"Bot {token}"}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{DISCORD_API}/gateway/bot", headers=headers) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return data["shards"], data.get("session_start_limit", {}).get("max_concurrency", 1)
+
+
+def shard_ranges(shard_count: int, clusters: int) -> List[List[int]]:
+    """Split shard ids into contiguous, nearly equal ranges, one per cluster"""
+    return [
+        list(range(i * shard_count // clusters, (i + 1) * shard_count // clusters))
+        for i in range(clusters)
+    ]
+
+
+def run_cluster(cluster_id: int, shard_ids: List[int], shard_count: int, delay: float) -> None:
+    """Process entry point: run one cluster's shards on its own event loop and caches"""
+    formatter = logging.Formatter(f'%(asctime)s - cluster {cluster_id} - %(name)s - %(levelname)s - %(message)s')
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(formatter)
+
+    # Clusters start staggered so their identifies stay within Discord's rate limit
+    time.sleep(delay)
+    logger.info(f"Starting shards {shard_ids[0]}-{shard_ids[-1]} of {shard_count}")
+    try:
+        asyncio.run(main(shard_ids, shard_count, cluster_id, killer=GracefulKiller()))
+    except Exception as e:
+        logger.critical(f"Cluster {cluster_id} failed: {e}", exc_info=e)
+        sys.exit(1)
+
+
+def run_clusters(clusters: int, shard_count: int) -> int:
+    """Spread shards over cluster processes and restart any that crash"""
+    max_concurrency = 1
+    if not shard_count:
+        shard_count, max_concurrency = asyncio.run(gateway_info(BotConfig().token))
+        logger.info(f"Discord recommends {shard_count} shards (identify concurrency {max_concurrency})")
+    clusters = max(1, min(clusters, shard_count))
+    ranges = shard_ranges(shard_count, clusters)
+
+    context = multiprocessing.get_context('spawn')
+    processes = {}
+    started = {}
+
+    def spawn(cluster_id: int, delay: float) -> None:
+        process = context.Process(
+            target=run_cluster,
+            args=(cluster_id, ranges[cluster_id], shard_count, delay),
+            name=f"cluster-{cluster_id}"
+        )
+        process.start()
+        processes[cluster_id] = process
+        started[cluster_id] = time.monotonic() + delay
+
+    killer = GracefulKiller()
+    for cluster_id, shard_ids in enumerate(ranges):
+        spawn(cluster_id, shard_ids[0] // max_concurrency * IDENTIFY_INTERVAL)
+    logger.info(f"Started {clusters} clusters for {shard_count} shards")
+
+    exit_code = 0
+    while processes and not killer.kill_now:
+        time.sleep(1)
+        for cluster_id, process in list(processes.items()):
+            if process.is_alive():
+                continue
+            del processes[cluster_id]
+            if process.exitcode == 0:
+                logger.info(f"Cluster {cluster_id} exited")
+            elif time.monotonic() - started[cluster_id] < MIN_CLUSTER_UPTIME:
+                logger.critical(f"Cluster {cluster_id} failed during startup (exit code {process.exitcode})")
+                exit_code = 1
+                killer.kill_now = True
+            else:
+                logger.error(f"Cluster {cluster_id} died (exit code {process.exitcode}), restarting")
+                spawn(cluster_id, CLUSTER_RESTART_DELAY)
+
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+    for process in processes.values():
+        process.join(timeout=30)
+    return exit_code
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the bot")
+    parser.add_argument('--clusters', type=int, default=None,
+                        help="Processes to spread shards over (defaults to SHARD_CLUSTERS or 1)")
+    parser.add_argument('--shards', type=int, default=None,
+                        help="Total shard count, 0 for Discord's recommendation (defaults to SHARD_COUNT)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        asyncio.run(main())
+        config = BotConfig()
+        clusters = config.shard_clusters if args.clusters is None else args.clusters
+        shard_count = config.shard_count if args.shards is None else args.shards
+        if clusters > 1:
+            sys.exit(run_clusters(clusters, shard_count))
+        asyncio.run(main(shard_count=shard_count or None))
     except KeyboardInterrupt:
         pass  # Handle clean exit on Ctrl+C
     except Exception as e:
@@ -0,0 +1,119 @@
+"""Measure character registry memory per character as the catalog grows.
+
+Run from the repository root:
+
+    python -m tools.benchmark_registry_memory --sizes 1000 10000 100000
+
+The real catalog is replicated up to each size and built under
+tracemalloc. Bytes per character should stay flat as the size grows.
+Shared records are compared with the old layout: plain dataclasses with
+alias lists and a separate GIF copy of each character. The registry
+column adds the lookup indexes on top of the records.
+"""
+import argparse
+import gc
+import logging
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from bot.cogs.utils.character_data import load_character_data
+from bot.cogs.utils.handlers import CharacterInfo, create_character_info
+from bot.cogs.utils.registry import CharacterRegistry
+
+logger = logging.getLogger('RegistryMemory')
+
+
+@dataclass
+class LegacyCharacterInfo:
+    """The pre-registry layout: a __dict__ per instance and a list of aliases"""
+    name: str
+    title: str
+    description: str
+    folder: str
+    source: str
+    aliases: List[str]
+
+
+def scaled_catalog(descriptions: dict, mappings: dict, size: int) -> Tuple[dict, dict]:
+    """Replicate the catalog until it holds roughly size characters"""
+    base = [(series, char_id) for series, chars in descriptions.items() for char_id in chars]
+    scaled_descriptions: Dict[str, dict] = {series: {} for series in descriptions}
+    scaled_mappings: Dict[str, dict] = {series: {} for series in descriptions}
+    for i in range(size):
+        series, char_id = base[i % len(base)]
+        copy_id = f"{char_id}_{i // len(base)}" if i >= len(base) else char_id
+        title, description = descriptions[series][char_id]
+        scaled_descriptions[series][copy_id] = (f"{title} {i // len(base)}", description)
+        scaled_mappings[series][copy_id] = [
+            f"{alias}_{i // len(base)}" for alias in mappings.get(series, {}).get(char_id, [char_id])
+        ]
+    return scaled_descriptions, scaled_mappings
+
+
+def build_records(descriptions: dict, mappings: dict) -> List[CharacterInfo]:
+    """One shared record per character, as the registry stores them"""
+    return [
+        create_character_info(char_id, series, desc_data, {char_id: mappings[series].get(char_id, [char_id])})
+        for series, chars in descriptions.items()
+        for char_id, desc_data in chars.items()
+    ]
+
+
+def build_legacy(descriptions: dict, mappings: dict) -> List[LegacyCharacterInfo]:
+    characters = []
+    for series, chars in descriptions.items():
+        for char_id, (title, description) in chars.items():
+            aliases = list(mappings[series].get(char_id, [char_id]))
+            source = series.replace('_', ' ').title()
+            characters.append(LegacyCharacterInfo(char_id, title, description, f"{series}/{char_id}", source, aliases))
+            characters.append(LegacyCharacterInfo(
+                char_id, f"{title} GIF", f"Animated GIF - {description}", f"{series}/{char_id}", source,
+                [f"gif_{char_id}", f"{char_id}-gif", *[f"{alias}_gif" for alias in aliases]]
+            ))
+    return characters
+
+
+def build_indexed_registry(descriptions: dict, mappings: dict) -> CharacterRegistry:
+    """The registry with its records and lookup indexes built, as the bot runs it"""
+    return CharacterRegistry(descriptions, mappings).ensure_built()
+
+
+def measure(build, *args) -> int:
+    """Bytes still allocated by build(*args) while its result is alive"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build(*args)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--data', default=None, help="Character data file (defaults to CHARACTER_DATA or the bundled file)")
+    args = parser.parse_args()
+
+    descriptions, mappings = load_character_data(args.data)
+    logging.getLogger('CharacterRegistry').setLevel(logging.WARNING)
+    logging.getLogger('AnimeHandlers').setLevel(logging.ERROR)
+
+    print(f"{'characters':>10}  {'records B/char':>14}  {'legacy B/char':>13}  {'registry B/char':>15}")
+    for size in args.sizes:
+        scaled = scaled_catalog(descriptions, mappings, size)
+        record_bytes = measure(build_records, *scaled)
+        legacy_bytes = measure(build_legacy, *scaled)
+        # Records plus the series, name and any-series indexes; the constructor alone builds nothing
+        registry_bytes = measure(build_indexed_registry, *scaled)
+        print(f"{size:>10}  {record_bytes / size:>14.0f}  {legacy_bytes / size:>13.0f}  {registry_bytes / size:>15.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Find near-duplicate images with perceptual hashes and store the clusters.
+
+Run from the repository root:
+
+    python -m tools.find_duplicates ./hentai/ --distance 6 --workers 4
+
+Hashes are stored next to the media catalog and only recomputed for files
+whose size or mtime changed. The bot loads the stored clusters at startup
+and treats each cluster as a single image when picking at random.
+"""
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from bot.cogs.utils.media_index import MediaIndex
+from bot.cogs.utils.phash import Image, PerceptualHashStore, cluster_hashes, dhash
+
+logger = logging.getLogger('FindDuplicates')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('root', nargs='?', default='./hentai/', help="Media root to scan")
+    parser.add_argument('--db', default=os.getenv('MEDIA_CATALOG', './data/media_catalog.sqlite3'))
+    parser.add_argument('--distance', type=int, default=6, help="Max Hamming distance between duplicates")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--top', type=int, default=20, help="Number of largest clusters to print")
+    args = parser.parse_args()
+
+    if Image is None:
+        logger.error("Pillow is required to compute perceptual hashes")
+        return 1
+
+    index = MediaIndex(args.root)
+    index.build()
+    store = PerceptualHashStore(args.db)
+    known = store.load_hashes()
+
+    hashes, sizes, pending = {}, {}, []
+    for file_path in index.all_files():
+        path = str(file_path.resolve())
+        stat = os.stat(path)
+        sizes[path] = stat.st_size
+        cached = known.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            hashes[path] = cached[2]
+        else:
+            pending.append((path, stat.st_size, stat.st_mtime_ns))
+
+    logger.info(f"{len(hashes)} hashes cached, computing {len(pending)}")
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = pool.map(dhash, [path for path, _, _ in pending], chunksize=64)
+        new_rows = []
+        for (path, size, mtime_ns), value in zip(pending, results):
+            if value is None:
+                logger.warning(f"Could not hash {path}")
+                continue
+            hashes[path] = value
+            new_rows.append((path, size, mtime_ns, value))
+    store.save_hashes(new_rows)
+
+    clusters = cluster_hashes(hashes, args.distance)
+    clusters.sort(key=len, reverse=True)
+    store.save_clusters(clusters)
+
+    duplicate_files = sum(len(cluster) - 1 for cluster in clusters)
+    reclaimable = sum(sum(sizes[p] for p in cluster) - max(sizes[p] for p in cluster) for cluster in clusters)
+    print(f"{len(clusters)} duplicate clusters, {duplicate_files} redundant files, "
+          f"{reclaimable / 1024 / 1024:.1f} MiB reclaimable")
+    for cluster in clusters[:args.top]:
+        print(f"\n{len(cluster)} files:")
+        for path in cluster:
+            print(f"  {os.path.relpath(path)} ({sizes[path]} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Convert a media tree in place to content-addressed storage.
+
+Run from the repository root:
+
+    python -m tools.migrate_cas ./hentai/ --dry-run
+    python -m tools.migrate_cas ./hentai/
+
+Every distinct file is kept once under <root>/.cas/objects and each folder
+entry shares its blob's storage, so paths the bot uses don't change.
+Entries are reflinks where the filesystem supports them and hardlinks
+otherwise; on a hardlinked tree, editing a file in place changes every
+copy of it, so replace files instead. The migration is idempotent and safe
+to re-run after adding or changing files.
+"""
+import argparse
+import logging
+import os
+import sys
+from collections import defaultdict
+
+from bot.cogs.utils.content_store import ContentStore
+from bot.cogs.utils.handlers import hash_file
+from bot.cogs.utils.media_index import MediaIndex
+
+logger = logging.getLogger('MigrateCAS')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('root', nargs='?', default='./hentai/', help="Media root to migrate")
+    parser.add_argument('--cas-dir', help="Blob store location (default: <root>/.cas)")
+    parser.add_argument('--dry-run', action='store_true', help="Only report how much space would be saved")
+    parser.add_argument('--hardlink', action='store_true', help="Always hardlink, even where reflinks work")
+    args = parser.parse_args()
+
+    index = MediaIndex(args.root)
+    index.build()
+    files = index.all_files()
+
+    if args.dry_run:
+        by_hash = defaultdict(list)
+        for file_path in files:
+            by_hash[hash_file(file_path)].append(os.path.getsize(file_path))
+        saved = sum(sum(sizes) - sizes[0] for sizes in by_hash.values())
+        print(f"{len(files)} files, {len(by_hash)} distinct, "
+              f"{saved / 1024 / 1024:.1f} MiB would be saved")
+        return 0
+
+    store = ContentStore(args.cas_dir or os.path.join(args.root, '.cas'), reflinks=not args.hardlink)
+    saved = failed = 0
+    with store.manifest() as conn:
+        for count, file_path in enumerate(files, start=1):
+            try:
+                _, freed = store.ingest(file_path, conn)
+                saved += freed
+            except OSError as e:
+                # Usually a cross-device link or a file removed mid-run
+                logger.error(f"Could not migrate {file_path}: {e}")
+                failed += 1
+            if count % 1000 == 0:
+                logger.info(f"Migrated {count}/{len(files)} files")
+
+    stats = store.stats()
+    print(f"{stats['entries']} entries backed by {stats['blobs']} blobs ({store.link_mode}s), "
+          f"{saved / 1024 / 1024:.1f} MiB saved, {failed} failed")
+    return 0 if not failed else 2
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sys.exit(main())
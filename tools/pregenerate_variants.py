@@ -0,0 +1,74 @@
+"""Build size variants for oversized images ahead of time.
+
+Run from the repository root:
+
+    python -m tools.pregenerate_variants ./hentai/ --limit 10485760 --workers 4
+"""
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bot.cogs.utils.disk_cache import DiskCache
+from bot.cogs.utils.handlers import hash_file
+from bot.cogs.utils.media_index import MediaIndex
+from bot.cogs.utils.transcode import (
+    UPLOAD_OVERHEAD, VARIANT_TIERS, Image, MediaTranscoder, make_size_variant, tier_for_limit
+)
+
+logger = logging.getLogger('PregenerateVariants')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('root', nargs='?', default='./hentai/', help="Media root to scan")
+    parser.add_argument('--limit', type=int, default=VARIANT_TIERS[0], help="Upload limit to build variants for")
+    parser.add_argument('--cache-dir', default=os.getenv('VARIANT_CACHE_DIR', './data/variants'))
+    parser.add_argument('--cache-bytes', type=int,
+                        default=int(os.getenv('VARIANT_CACHE_BYTES', str(2 * 1024 * 1024 * 1024))))
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    if Image is None:
+        logger.error("Pillow is required to build size variants")
+        return 1
+
+    index = MediaIndex(args.root)
+    index.build()
+    cache = DiskCache(args.cache_dir, args.cache_bytes)
+    tier = tier_for_limit(args.limit)
+
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for file_path in index.all_files():
+            if os.path.getsize(file_path) <= args.limit:
+                continue
+            name = MediaTranscoder.variant_name(hash_file(file_path), tier)
+            if name in cache:
+                continue
+            job = pool.submit(make_size_variant, str(file_path), str(cache.path_for(name)), tier - UPLOAD_OVERHEAD)
+            jobs[job] = (file_path, name)
+
+        built = 0
+        for job in as_completed(jobs):
+            file_path, name = jobs[job]
+            try:
+                size = job.result()
+            except Exception as e:
+                logger.error(f"Failed to build variant for {file_path}: {e}")
+                continue
+            if size is None:
+                logger.warning(f"No variant under {tier} bytes for {file_path}")
+                continue
+            cache.add(name)
+            built += 1
+            logger.info(f"{file_path} -> {name} ({size} bytes)")
+
+    logger.info(f"Built {built}/{len(jobs)} variants, cache now {cache.current_bytes} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sys.exit(main())